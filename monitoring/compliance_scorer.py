@@ -4,13 +4,91 @@ FCM Repository Compliance Scoring System
 Implementation of Layer 4 health monitoring from the GitHub Repository Model
 """
 
+import atexit
+import bisect
 import json
 import math
+import operator
+import queue
+import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+
+
+# Ascending score thresholds and the label awarded at or above each one.
+# ``bisect_right`` over the threshold tuple indexes straight into the labels.
+_GRADE_THRESHOLDS = (0.45, 0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90, 0.95)
+_GRADE_LABELS = ("F", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+_COMPLIANCE_THRESHOLDS = (0.30, 0.45, 0.60, 0.75, 0.90)
+_COMPLIANCE_LABELS = ("basic", "structured", "documented", "tested", "secure", "exemplary")
+
+# Status levels in ascending order; "critical" is the floor below "poor"
+_STATUS_LEVELS = ("poor", "fair", "good", "excellent")
+_STATUS_LABELS = ("critical",) + _STATUS_LEVELS
+# Validation health metrics consumed by the scorer, in extraction order
+_BASE_METRIC_KEYS = (
+    "structural_health",
+    "content_health",
+    "process_health",
+    "security_health",
+    "overall_health"
+)
+_BASE_METRIC_DEFAULTS = (0.0,) * len(_BASE_METRIC_KEYS)
+
+# Report glyphs for metric status and trend
+_STATUS_EMOJI = {
+    "excellent": "🟢",
+    "good": "🔵",
+    "fair": "🟡",
+    "poor": "🟠",
+    "critical": "🔴"
+}
+_TREND_EMOJI = {
+    "improving": "📈",
+    "stable": "➡️",
+    "declining": "📉"
+}
+
+# History is stored as JSON lines so each save appends instead of rewriting;
+# the file is compacted back to the retention limit once it doubles
+_HISTORY_FILE = "compliance_history.jsonl"
+_LEGACY_HISTORY_FILE = "compliance_history.json"  # single JSON array, read only
+_HISTORY_LIMIT = 100
+_HISTORY_COMPACT_AT = 2 * _HISTORY_LIMIT
+
+# One daemon thread, shared by every scorer, writes queued (scorer, entries)
+# jobs; it only references a scorer while that scorer has entries pending
+_history_queue = queue.Queue()
+_history_writer_lock = threading.Lock()
+_history_writer_thread = None
+
+# Violation keywords and their penalties; when several keywords occur in one
+# violation the most severe penalty wins. ASCII-only case folding keeps every
+# match a key of the table (IGNORECASE alone also matches e.g. "miſſing").
+_PENALTY_RE = re.compile(r"critical|missing required|warning|recommended", re.IGNORECASE | re.ASCII)
+_PENALTY_TABLE = {
+    "critical": 0.1,
+    "missing required": 0.1,
+    "warning": 0.02,
+    "recommended": 0.02
+}
+_DEFAULT_PENALTY = 0.05
+
+# math.sumprod (Python 3.12+) fuses the multiply and sum into one C loop.
+# It rounds the sum once, so its result can differ from a left-to-right sum in
+# the last place; older interpreters keep the left-to-right sum unchanged.
+if hasattr(math, "sumprod"):
+    _sumprod = math.sumprod
+else:
+    def _sumprod(values, weights) -> float:
+        return sum(map(operator.mul, values, weights))
 
 
 class HealthCategory(Enum):
@@ -22,7 +100,7 @@ class HealthCategory(Enum):
     EVOLUTION = "evolution"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthMetric:
     """Individual health metric"""
     name: str
@@ -34,7 +112,7 @@ class HealthMetric:
     last_updated: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceScore:
     """Complete compliance scoring result"""
     overall_score: float
@@ -46,6 +124,117 @@ class ComplianceScore:
     recommendations: List[str] = field(default_factory=list)
 
 
+def _read_history_file(history_path: Path) -> Tuple[List[Dict], bool]:
+    """
+    Read every history entry from disk.
+    
+    Returns the entries and whether the file needs rewriting, i.e. it is in
+    the legacy single-JSON-array format or contains unreadable lines.
+    """
+    try:
+        text = history_path.read_text()
+    except FileNotFoundError:
+        return [], False
+    
+    if text.lstrip().startswith("["):
+        try:
+            return json.loads(text), True
+        except json.JSONDecodeError:
+            return [], True
+    
+    history = []
+    needs_rewrite = False
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            history.append(json.loads(line))
+        except json.JSONDecodeError:
+            needs_rewrite = True
+    
+    return history, needs_rewrite
+
+
+def load_history(history_path: Path) -> List[Dict]:
+    """Load the retained compliance history (JSON lines or legacy JSON array)"""
+    history, _ = _read_history_file(Path(history_path))
+    return history[-_HISTORY_LIMIT:]
+
+
+def _start_history_writer():
+    """Start the shared history writer thread if it is not running yet"""
+    global _history_writer_thread
+    with _history_writer_lock:
+        if _history_writer_thread is None:
+            _history_writer_thread = threading.Thread(
+                target=_history_writer, name="compliance-history-writer", daemon=True
+            )
+            _history_writer_thread.start()
+            
+            # Daemon threads are killed at exit, so drain the queue first
+            atexit.register(_history_queue.join)
+
+
+def _history_writer():
+    """Write queued jobs, coalescing everything queued so far into one write per scorer"""
+    while True:
+        jobs = [_history_queue.get()]
+        while True:
+            try:
+                jobs.append(_history_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            _write_history_jobs(jobs)
+        finally:
+            for _ in range(len(jobs)):
+                _history_queue.task_done()
+            # Drop the scorer references before blocking on the next job
+            jobs = None
+
+
+def _write_history_jobs(jobs: List[Tuple["ComplianceScorer", List[Dict]]]):
+    """Append each scorer's queued entries, recording failures on the scorer"""
+    pending = {}
+    for scorer, entries in jobs:
+        pending.setdefault(id(scorer), (scorer, []))[1].extend(entries)
+    
+    for scorer, entries in pending.values():
+        try:
+            scorer._append_history(entries)
+        except Exception as e:
+            scorer._history_error = e
+
+
+@lru_cache(maxsize=256)
+def _classify_trends(categories: Tuple[str, ...], first_overall: float, last_overall: float,
+                     first_scores: Tuple[float, ...], last_scores: Tuple[float, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Classify overall and per-category trends from window endpoints.
+    
+    Memoized on the endpoint values, so re-scoring against unchanged
+    history skips the classification entirely.
+    """
+    if last_overall > first_overall * 1.05:
+        overall = "improving"
+    elif last_overall < first_overall * 0.95:
+        overall = "declining"
+    else:
+        overall = "stable"
+    
+    trends = [("overall", overall)]
+    for category, first, last in zip(categories, first_scores, last_scores):
+        if last > first:
+            trends.append((category, "improving"))
+        elif last < first:
+            trends.append((category, "declining"))
+        else:
+            trends.append((category, "stable"))
+    
+    return tuple(trends)
+
+
 class ComplianceScorer:
     """
     Advanced compliance scoring implementing Layer 4 dynamics from the formal model
@@ -54,8 +243,35 @@ class ComplianceScorer:
     def __init__(self):
         """Initialize scorer with metric definitions"""
         self.metric_definitions = self._load_metric_definitions()
+        
+        # Flatten definitions into parallel tuples so scoring iterates by index
+        # instead of re-walking the nested definition dicts on every call
+        definitions = self.metric_definitions.values()
+        self.metric_names = tuple(self.metric_definitions)
+        self.metric_categories = tuple(d["category"] for d in definitions)
+        self.metric_weights = tuple(d["weight"] for d in definitions)
+        self.status_thresholds = tuple(
+            self._build_status_thresholds(d["thresholds"]) for d in definitions
+        )
+        self.base_metric_indexes = tuple(
+            _BASE_METRIC_KEYS.index(name) if name in _BASE_METRIC_KEYS else None
+            for name in self.metric_names
+        )
+        
+        # Display names and recommendation texts only depend on the metric
+        # name, so render them once rather than on every report
+        self.display_names = {name: self._format_name(name) for name in self.metric_names}
+        self.recommendation_templates = {
+            name: self._build_recommendation_templates(self.display_names[name])
+            for name in self.metric_names
+        }
         self.scoring_algorithms = self._load_scoring_algorithms()
-        self.history_path = Path("compliance_history.json")
+        # Resolved now, so a later change of working directory does not move the file
+        self.history_path = Path(_HISTORY_FILE).absolute()
+        self.legacy_history_path = Path(_LEGACY_HISTORY_FILE).absolute()
+        self._history = None  # retained entries, loaded on first save
+        self._history_size = 0  # entries currently in the history file
+        self._history_error = None  # last failure of the background writer
     
     def _load_metric_definitions(self) -> Dict[str, Dict]:
         """Define all health metrics from the formal model"""
@@ -151,6 +367,27 @@ class ComplianceScorer:
             }
         }
     
+    def _build_status_thresholds(self, thresholds: Dict[str, float]) -> Tuple[float, ...]:
+        """Flatten a thresholds dict into an ascending tuple for bisection"""
+        return tuple(thresholds[level] for level in _STATUS_LEVELS)
+    
+    def _format_name(self, name: str) -> str:
+        """Turn a snake_case metric name into a display title"""
+        return name.replace('_', ' ').title()
+    
+    def _display_name(self, name: str) -> str:
+        """Display title for a metric, category or trend key"""
+        display_name = self.display_names.get(name)
+        return display_name if display_name is not None else self._format_name(name)
+    
+    def _build_recommendation_templates(self, display_name: str) -> Dict[str, str]:
+        """Pre-render per-metric recommendation texts, leaving only the score to fill in"""
+        return {
+            "critical": f"🚨 CRITICAL: {display_name} needs immediate attention (score: {{value:.2f}})",
+            "poor": f"⚠️ {display_name} below acceptable threshold (score: {{value:.2f}})",
+            "declining": f"📉 {display_name} is declining - investigate causes"
+        }
+    
     def _load_scoring_algorithms(self) -> Dict[str, callable]:
         """Define scoring algorithms for different aspects"""
         return {
@@ -165,33 +402,60 @@ class ComplianceScorer:
         """
         Main scoring function implementing Layer 4 scoring dynamics
         """
-        # Initialize with placeholder score, will be calculated below
-        score = ComplianceScore(overall_score=0.0)
+        return self.calculate_compliance_scores([validation_result], historical_data)[0]
+    
+    def calculate_compliance_scores(self, validation_results: List[Dict[str, Any]],
+                                  historical_data: List[Dict] = None) -> List[ComplianceScore]:
+        """
+        Score a batch of validation results against shared historical data
+        """
+        # Trends depend only on the history, so analyze them once per batch
+        trend_analysis = self._analyze_trends(historical_data) if historical_data else None
+        
+        # Every metric in the batch shares one wall-clock reading
+        now = datetime.now()
         
+        scores = [
+            self._score_validation_result(validation_result, now, trend_analysis)
+            for validation_result in validation_results
+        ]
+        
+        # Save the whole batch to history in a single write
+        self._save_to_history(scores, now)
+        
+        return scores
+    
+    def _score_validation_result(self, validation_result: Dict[str, Any], now: datetime,
+                               trend_analysis: Dict[str, str] = None) -> ComplianceScore:
+        """Score a single validation result"""
         # Extract base metrics from validation result
         base_metrics = self._extract_base_metrics(validation_result)
         
         # Calculate category scores
-        for category_name, definition in self.metric_definitions.items():
-            category_score = self._calculate_category_score(
-                category_name, base_metrics, definition
-            )
-            score.category_scores[category_name] = category_score
-            
-            # Create health metric
-            metric = HealthMetric(
-                name=category_name,
-                category=definition["category"],
-                value=category_score,
-                weight=definition["weight"],
-                status=self._determine_status(category_score, definition["thresholds"])
-            )
-            score.metrics.append(metric)
-        
-        # Calculate overall score using weighted average
-        score.overall_score = sum(
-            score.category_scores[name] * definition["weight"]
-            for name, definition in self.metric_definitions.items()
+        values = [
+            self._calculate_category_score(name, base_index, base_metrics)
+            for name, base_index in zip(self.metric_names, self.base_metric_indexes)
+        ]
+        
+        # Build the category map and the metric list at their final size in
+        # one go instead of growing the dataclass defaults entry by entry
+        score = ComplianceScore(
+            overall_score=_sumprod(values, self.metric_weights),
+            category_scores=dict(zip(self.metric_names, values)),
+            metrics=[
+                HealthMetric(
+                    name=name,
+                    category=category,
+                    value=value,
+                    weight=weight,
+                    status=status,
+                    last_updated=now
+                )
+                for name, category, value, weight, status in zip(
+                    self.metric_names, self.metric_categories, values,
+                    self.metric_weights, self._determine_statuses(values)
+                )
+            ]
         )
         
         # Determine compliance level
@@ -200,145 +464,83 @@ class ComplianceScorer:
         # Calculate health grade
         score.health_grade = self._calculate_health_grade(score.overall_score)
         
-        # Analyze trends if historical data available
-        if historical_data:
-            score.trend_analysis = self._analyze_trends(historical_data, score)
+        # Apply trends if historical data available
+        if trend_analysis is not None:
+            score.trend_analysis = dict(trend_analysis)
             self._adjust_score_for_trends(score)
         
         # Generate recommendations
         score.recommendations = self._generate_recommendations(score)
         
-        # Save to history
-        self._save_to_history(score)
-        
         return score
     
-    def _extract_base_metrics(self, validation_result: Dict[str, Any]) -> Dict[str, float]:
-        """Extract base metrics from validation result"""
+    def _extract_base_metrics(self, validation_result: Dict[str, Any]) -> Tuple[float, ...]:
+        """Extract base metrics from validation result, ordered as _BASE_METRIC_KEYS"""
         health_metrics = validation_result.get("health_metrics", {})
-        
-        return {
-            "structural_health": health_metrics.get("structural_health", 0.0),
-            "content_health": health_metrics.get("content_health", 0.0),
-            "process_health": health_metrics.get("process_health", 0.0),
-            "security_health": health_metrics.get("security_health", 0.0),
-            "overall_health": health_metrics.get("overall_health", 0.0)
-        }
+        return tuple(map(health_metrics.get, _BASE_METRIC_KEYS, _BASE_METRIC_DEFAULTS))
     
-    def _calculate_category_score(self, category_name: str, base_metrics: Dict[str, float],
-                                definition: Dict[str, Any]) -> float:
+    def _calculate_category_score(self, category_name: str, base_index: Optional[int],
+                                base_metrics: Tuple[float, ...]) -> float:
         """Calculate score for a specific category"""
-        if category_name in base_metrics:
-            base_score = base_metrics[category_name]
-        else:
-            # Calculate from components if base not available
-            base_score = 0.5  # Default neutral score
-        
         # Apply category-specific adjustments
         if category_name == "evolution_health":
             # Evolution health needs special calculation
             return self._calculate_evolution_health(base_metrics)
         
-        return base_score
+        if base_index is None:
+            # Calculate from components if base not available
+            return 0.5  # Default neutral score
+        
+        return base_metrics[base_index]
     
-    def _calculate_evolution_health(self, base_metrics: Dict[str, float]) -> float:
+    def _calculate_evolution_health(self, base_metrics: Tuple[float, ...]) -> float:
         """Calculate evolution health based on improvement patterns"""
         # This would analyze commit history, improvement trends, etc.
         # For now, return a calculated estimate
-        avg_health = sum(base_metrics.values()) / len(base_metrics) if base_metrics else 0.5
+        avg_health = sum(base_metrics) / len(base_metrics) if base_metrics else 0.5
         
         # Evolution health correlates with overall health but with some randomness
         # representing adaptation and change capability
         evolution_factor = 0.8 + (avg_health * 0.2)  # Base evolution capability
         return min(1.0, evolution_factor)
     
-    def _determine_status(self, score: float, thresholds: Dict[str, float]) -> str:
-        """Determine status level based on score and thresholds"""
-        if score >= thresholds["excellent"]:
-            return "excellent"
-        elif score >= thresholds["good"]:
-            return "good"
-        elif score >= thresholds["fair"]:
-            return "fair"
-        elif score >= thresholds["poor"]:
-            return "poor"
-        else:
-            return "critical"
+    def _determine_statuses(self, values: List[float]) -> List[str]:
+        """Determine the status level of every metric value in one pass"""
+        bisect_right = bisect.bisect_right
+        return [
+            _STATUS_LABELS[bisect_right(thresholds, value)]
+            for value, thresholds in zip(values, self.status_thresholds)
+        ]
     
     def _determine_compliance_level(self, overall_score: float) -> str:
         """Map overall score to compliance level"""
-        if overall_score >= 0.90:
-            return "exemplary"
-        elif overall_score >= 0.75:
-            return "secure"
-        elif overall_score >= 0.60:
-            return "tested"
-        elif overall_score >= 0.45:
-            return "documented"
-        elif overall_score >= 0.30:
-            return "structured"
-        else:
-            return "basic"
+        return _COMPLIANCE_LABELS[bisect.bisect_right(_COMPLIANCE_THRESHOLDS, overall_score)]
     
     def _calculate_health_grade(self, overall_score: float) -> str:
         """Calculate letter grade for health"""
-        if overall_score >= 0.95:
-            return "A+"
-        elif overall_score >= 0.90:
-            return "A"
-        elif overall_score >= 0.85:
-            return "A-"
-        elif overall_score >= 0.80:
-            return "B+"
-        elif overall_score >= 0.75:
-            return "B"
-        elif overall_score >= 0.70:
-            return "B-"
-        elif overall_score >= 0.65:
-            return "C+"
-        elif overall_score >= 0.60:
-            return "C"
-        elif overall_score >= 0.55:
-            return "C-"
-        elif overall_score >= 0.50:
-            return "D+"
-        elif overall_score >= 0.45:
-            return "D"
-        else:
-            return "F"
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_THRESHOLDS, overall_score)]
     
-    def _analyze_trends(self, historical_data: List[Dict], current_score: ComplianceScore) -> Dict[str, str]:
+    def _analyze_trends(self, historical_data: List[Dict]) -> Dict[str, str]:
         """Analyze trends from historical data"""
         if len(historical_data) < 2:
             return {"overall": "insufficient_data"}
         
-        trends = {}
-        
-        # Analyze overall trend
-        recent_scores = [entry["overall_score"] for entry in historical_data[-5:]]
-        if len(recent_scores) >= 2:
-            if recent_scores[-1] > recent_scores[0] * 1.05:
-                trends["overall"] = "improving"
-            elif recent_scores[-1] < recent_scores[0] * 0.95:
-                trends["overall"] = "declining"
-            else:
-                trends["overall"] = "stable"
-        
-        # Analyze category trends
-        for category in self.metric_definitions.keys():
-            category_scores = [
-                entry.get("category_scores", {}).get(category, 0.5)
-                for entry in historical_data[-3:]
-            ]
-            if len(category_scores) >= 2:
-                if category_scores[-1] > category_scores[0]:
-                    trends[category] = "improving"
-                elif category_scores[-1] < category_scores[0]:
-                    trends[category] = "declining"
-                else:
-                    trends[category] = "stable"
-        
-        return trends
+        count = len(historical_data)
+        
+        # Only the endpoints of each trailing window decide its trend, so
+        # read those entries directly instead of materializing the windows:
+        # the last 5 entries for the overall trend, the last 3 per category
+        last_entry = historical_data[-1]
+        first_categories = historical_data[-min(count, 3)].get("category_scores", {})
+        last_categories = last_entry.get("category_scores", {})
+        
+        return dict(_classify_trends(
+            self.metric_names,
+            historical_data[-min(count, 5)]["overall_score"],
+            last_entry["overall_score"],
+            tuple(first_categories.get(category, 0.5) for category in self.metric_names),
+            tuple(last_categories.get(category, 0.5) for category in self.metric_names)
+        ))
     
     def _adjust_score_for_trends(self, score: ComplianceScore):
         """Adjust score based on trend analysis"""
@@ -362,18 +564,16 @@ class ComplianceScorer:
         
         # Category-specific recommendations
         for metric in score.metrics:
+            templates = self.recommendation_templates.get(metric.name)
+            if templates is None:
+                templates = self._build_recommendation_templates(self._display_name(metric.name))
+            
             if metric.status == "critical":
-                recommendations.append(
-                    f"🚨 CRITICAL: {metric.name.replace('_', ' ').title()} needs immediate attention (score: {metric.value:.2f})"
-                )
+                recommendations.append(templates["critical"].format(value=metric.value))
             elif metric.status == "poor":
-                recommendations.append(
-                    f"⚠️ {metric.name.replace('_', ' ').title()} below acceptable threshold (score: {metric.value:.2f})"
-                )
+                recommendations.append(templates["poor"].format(value=metric.value))
             elif metric.trend == "declining":
-                recommendations.append(
-                    f"📉 {metric.name.replace('_', ' ').title()} is declining - investigate causes"
-                )
+                recommendations.append(templates["declining"])
         
         # Overall recommendations
         if score.overall_score < 0.5:
@@ -389,54 +589,93 @@ class ComplianceScorer:
         
         return recommendations
     
-    def _save_to_history(self, score: ComplianceScore):
-        """Save score to historical tracking"""
-        history_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "overall_score": score.overall_score,
-            "compliance_level": score.compliance_level,
-            "health_grade": score.health_grade,
-            "category_scores": score.category_scores,
-            "trend_analysis": score.trend_analysis
-        }
-        
-        # Load existing history
-        history = []
-        if self.history_path.exists():
-            try:
-                with open(self.history_path, 'r') as f:
-                    history = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                history = []
-        
-        # Add new entry
-        history.append(history_entry)
+    def _save_to_history(self, scores: List[ComplianceScore], timestamp: datetime):
+        """Queue scores for historical tracking; the file is written in the background"""
+        if not scores:
+            return
+        
+        # Format the shared batch timestamp once rather than per entry. The
+        # dicts are copied since the writer serializes them later.
+        timestamp_text = timestamp.isoformat()
+        history_entries = [
+            {
+                "timestamp": timestamp_text,
+                "overall_score": score.overall_score,
+                "compliance_level": score.compliance_level,
+                "health_grade": score.health_grade,
+                "category_scores": dict(score.category_scores),
+                "trend_analysis": dict(score.trend_analysis)
+            }
+            for score in scores
+        ]
         
-        # Keep only last 100 entries
-        history = history[-100:]
+        _start_history_writer()
+        _history_queue.put((self, history_entries))
+    
+    def flush_history(self):
+        """
+        Block until all queued history entries have been written to disk,
+        re-raising the last write failure of this scorer
+        """
+        _history_queue.join()
         
-        # Save updated history
-        with open(self.history_path, 'w') as f:
-            json.dump(history, f, indent=2)
+        if self._history_error is not None:
+            error, self._history_error = self._history_error, None
+            raise error
+    
+    def _append_history(self, history_entries: List[Dict]):
+        """Append entries to the history file, compacting it when it grows too long"""
+        # Load the retained history once; after that it is kept in memory and
+        # the deque drops the oldest entries as new ones arrive
+        needs_rewrite = False
+        if self._history is None:
+            source = self.history_path
+            if not source.exists() and self.legacy_history_path.exists():
+                # Carry the legacy history over; the old file is left untouched
+                source = self.legacy_history_path
+            history, needs_rewrite = _read_history_file(source)
+            needs_rewrite = needs_rewrite or source != self.history_path
+            self._history = deque(history, maxlen=_HISTORY_LIMIT)
+            self._history_size = len(history)
+        
+        self._history.extend(history_entries)
+        
+        if needs_rewrite or self._history_size + len(history_entries) > _HISTORY_COMPACT_AT:
+            # Compact the file down to the retained entries
+            self._write_history(self._history, "w")
+            self._history_size = len(self._history)
+        else:
+            self._write_history(history_entries, "a")
+            self._history_size += len(history_entries)
+    
+    def _write_history(self, entries: Iterable[Dict], mode: str):
+        """Write history entries as JSON lines, appending or replacing the file"""
+        with open(self.history_path, mode) as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
     
     def _weighted_average_score(self, scores: List[float], weights: List[float]) -> float:
         """Calculate weighted average score"""
         if not scores or not weights or len(scores) != len(weights):
             return 0.0
-        return sum(s * w for s, w in zip(scores, weights)) / sum(weights)
+        return _sumprod(scores, weights) / sum(weights)
     
     def _exponential_decay_score(self, scores: List[float], decay_factor: float = 0.9) -> float:
         """Calculate score with exponential decay for older entries"""
         if not scores:
             return 0.0
         
+        # Horner's scheme: the newest score ends up with weight 1, the one
+        # before it with decay_factor, and so on - no per-entry power calls
         weighted_sum = 0.0
-        weight_sum = 0.0
+        for score in scores:
+            weighted_sum = weighted_sum * decay_factor + score
         
-        for i, score in enumerate(reversed(scores)):
-            weight = decay_factor ** i
-            weighted_sum += score * weight
-            weight_sum += weight
+        # The weights form a geometric series, so their sum has a closed form
+        n = len(scores)
+        if decay_factor == 1.0:
+            weight_sum = float(n)
+        else:
+            weight_sum = (1.0 - decay_factor ** n) / (1.0 - decay_factor)
         
         return weighted_sum / weight_sum if weight_sum > 0 else 0.0
     
@@ -455,12 +694,10 @@ class ComplianceScorer:
         penalty = 0.0
         
         for violation in violations:
-            if "critical" in violation.lower() or "missing required" in violation.lower():
-                penalty += 0.1
-            elif "warning" in violation.lower() or "recommended" in violation.lower():
-                penalty += 0.02
-            else:
-                penalty += 0.05
+            penalty += max(
+                (_PENALTY_TABLE[keyword.lower()] for keyword in _PENALTY_RE.findall(violation)),
+                default=_DEFAULT_PENALTY
+            )
         
         return max(0.0, base_score - penalty)
     
@@ -478,23 +715,11 @@ class ComplianceScorer:
         # Category breakdown
         report.append("## Category Scores")
         report.append("")
-        for metric in score.metrics:
-            status_emoji = {
-                "excellent": "🟢",
-                "good": "🔵", 
-                "fair": "🟡",
-                "poor": "🟠",
-                "critical": "🔴"
-            }.get(metric.status, "⚪")
-            
-            trend_emoji = {
-                "improving": "📈",
-                "stable": "➡️",
-                "declining": "📉"
-            }.get(metric.trend, "➡️")
-            
-            report.append(f"- **{metric.name.replace('_', ' ').title()}:** {metric.value:.2f} {status_emoji} {trend_emoji}")
-        
+        report.extend(
+            f"- **{self._display_name(metric.name)}:** {metric.value:.2f} "
+            f"{_STATUS_EMOJI.get(metric.status, '⚪')} {_TREND_EMOJI.get(metric.trend, '➡️')}"
+            for metric in score.metrics
+        )
         report.append("")
         
         # Recommendations
@@ -510,7 +735,7 @@ class ComplianceScorer:
             report.append("## Trend Analysis")
             report.append("")
             for category, trend in score.trend_analysis.items():
-                report.append(f"- **{category.replace('_', ' ').title()}:** {trend}")
+                report.append(f"- **{self._display_name(category)}:** {trend}")
         
         return "\n".join(report)
 
@@ -533,8 +758,7 @@ def main():
     # Load historical data if provided
     historical_data = []
     if args.history and Path(args.history).exists():
-        with open(args.history, 'r') as f:
-            historical_data = json.load(f)
+        historical_data = load_history(args.history)
     
     # Calculate compliance score
     scorer = ComplianceScorer()
@@ -555,6 +779,9 @@ def main():
         print(scorer.generate_report(score))
     else:
         print(scorer.generate_report(score))
+    
+    # Surface any failure of the background history write
+    scorer.flush_history()
 
 
 if __name__ == "__main__":
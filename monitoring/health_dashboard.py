@@ -4,15 +4,284 @@ FCM Repository Health Monitoring Dashboard
 Implementation of Layer 5 organizational intelligence from the GitHub Repository Model
 """
 
+import bisect
+import io
+import itertools
 import json
+import math
 import sqlite3
+import struct
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from statistics import fmean
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 import argparse
 
 
+# Bump whenever the on-disk layout changes; databases written by an older
+# version are rebuilt into the current layout by HealthDatabase._migrate
+_SCHEMA_VERSION = 5
+
+_TABLES = ("repository_health", "validation_history", "remediation_history")
+
+# Natural key of each history table; rows sharing one are told apart by seq
+_TABLE_KEYS = {
+    "repository_health": ("repo_name", "timestamp"),
+    "validation_history": ("repo_name", "timestamp", "violation_type", "violation_message"),
+    "remediation_history": ("repo_name", "timestamp", "action_type", "action_description"),
+}
+
+
+def _to_epoch_us(moment: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch"""
+    # Whole seconds convert exactly; adding the microseconds separately
+    # avoids float rounding in datetime.timestamp()
+    return int(moment.replace(microsecond=0).timestamp()) * 1_000_000 + moment.microsecond
+
+
+def _from_epoch_us(epoch_us: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch back to a datetime"""
+    seconds, microseconds = divmod(epoch_us, 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=microseconds)
+
+
+def _iso_to_epoch_us(text: str) -> int:
+    """SQL migration helper converting legacy ISO-8601 timestamps"""
+    return _to_epoch_us(datetime.fromisoformat(text))
+
+
+# raw_data BLOBs start with a one-byte codec tag so the encoding can change
+# without another table rebuild
+_RAW_CODEC_ZLIB = b"\x01"
+_RAW_COMPRESS_LEVEL = 6
+
+
+def encode_raw(raw_data: Dict[str, Any]) -> bytes:
+    """Serialize a raw validation result into a compressed raw_data BLOB"""
+    payload = json.dumps(raw_data, separators=(",", ":")).encode("utf-8")
+    return _RAW_CODEC_ZLIB + zlib.compress(payload, _RAW_COMPRESS_LEVEL)
+
+
+def decode_raw(blob) -> Dict[str, Any]:
+    """Deserialize a raw_data column value back into the raw validation result"""
+    if blob is None:
+        return {}
+    if isinstance(blob, str):
+        # Uncompressed JSON TEXT written before schema version 3
+        return json.loads(blob)
+    
+    codec, payload = blob[:1], blob[1:]
+    if codec == _RAW_CODEC_ZLIB:
+        return json.loads(zlib.decompress(payload))
+    raise ValueError(f"Unknown raw_data codec: {codec!r}")
+
+
+def _compress_raw_text(text: Optional[str]) -> Optional[bytes]:
+    """SQL migration helper compressing legacy JSON TEXT raw_data"""
+    return None if text is None else encode_raw(json.loads(text))
+
+
+# The five category scores are packed into one little-endian float32 BLOB.
+# Single precision keeps ~7 significant digits, far beyond the two decimals
+# the reports display, at half the bytes of five REAL columns
+_CATEGORY_NAMES = ("structural_health", "content_health", "process_health", "security_health", "evolution_health")
+_CATEGORY_STRUCT = struct.Struct("<5f")
+
+
+def _pack_category_scores(*scores: Optional[float]) -> bytes:
+    """SQL migration helper packing legacy per-category REAL columns"""
+    return _CATEGORY_STRUCT.pack(*(score or 0.0 for score in scores))
+
+
+_COMPLIANCE_LEVELS = ("basic", "structured", "documented", "tested", "secure", "exemplary")
+
+
+_TREND_EMOJI = {
+    "improving": "📈",
+    "stable": "➡️",
+    "declining": "📉"
+}
+
+# HTML row highlighting: ``bisect_right`` over the thresholds indexes the
+# class. Critical is below 0.4 and good is strictly above 0.8, hence the
+# upper bound sits on the next float past 0.8.
+_ROW_CLASS_THRESHOLDS = (0.4, math.nextafter(0.8, math.inf))
+_ROW_CLASS_LABELS = ("critical", "", "good")
+
+# Per-row markdown templates, parsed once at import rather than per row
+_MD_DISTRIBUTION_ROW = "| {level} | {count} | {percentage:.1f}% |\n"
+_MD_REPOSITORY_ROW = (
+    "| {name} | {health.overall_score:.2f} | {health.health_grade} | {health.compliance_level} "
+    "| {trend} | {health.violations_count} |\n"
+)
+_MD_CRITICAL_ROW = "- **{name}**: Score {health.overall_score:.2f} - {health.violations_count} violations\n"
+
+
+_HTML_REPOSITORY_ROW = """
+                <tr class="{row_class}">
+                    <td>{name}</td>
+                    <td>{health.overall_score:.2f}</td>
+                    <td>{health.health_grade}</td>
+                    <td>{health.compliance_level}</td>
+                    <td>{health.trend}</td>
+                    <td>{health.violations_count}</td>
+                </tr>
+                """
+
+
+# SQL statements are kept as module constants so every call passes the same
+# text and hits the connection's prepared-statement cache
+
+_SQL_SCHEMA = """
+    -- Append-only histories keyed by their natural (repo_name, timestamp, ...)
+    -- key plus a seq tiebreak that numbers rows sharing it, so repeated
+    -- entries are all kept; WITHOUT ROWID clusters rows on that key so
+    -- per-repository range scans read the table directly with no separate
+    -- rowid b-tree or index
+    CREATE TABLE IF NOT EXISTS repository_health (
+        repo_name TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        overall_score REAL NOT NULL,
+        compliance_level TEXT NOT NULL,
+        health_grade TEXT NOT NULL,
+        category_scores BLOB NOT NULL,
+        violations_count INTEGER,
+        trend TEXT,
+        raw_data BLOB,
+        seq INTEGER NOT NULL DEFAULT 0,
+        -- Newest first, matching the latest-snapshot queries
+        PRIMARY KEY (repo_name, timestamp DESC, seq DESC)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS validation_history (
+        repo_name TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        violation_type TEXT NOT NULL,
+        violation_message TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        seq INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (repo_name, timestamp, violation_type, violation_message, seq)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS remediation_history (
+        repo_name TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
+        action_type TEXT NOT NULL,
+        action_description TEXT NOT NULL,
+        safety_level TEXT NOT NULL,
+        success BOOLEAN NOT NULL,
+        seq INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (repo_name, timestamp, action_type, action_description, seq)
+    ) WITHOUT ROWID;
+"""
+
+# Columns read back into a RepositoryHealth, in _row_to_health order
+_SQL_HEALTH_COLUMNS = """
+    repo_name, timestamp, overall_score, compliance_level, health_grade,
+    category_scores, violations_count, trend
+"""
+
+# A snapshot whose (repo_name, timestamp) is already stored takes the next
+# seq rather than replacing it; the MAX is a single primary-key seek
+_SQL_INSERT_HEALTH = """
+    INSERT INTO repository_health (
+        repo_name, timestamp, overall_score, compliance_level, health_grade,
+        category_scores, violations_count, trend, raw_data, seq
+    ) VALUES (
+        ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9,
+        (SELECT COALESCE(MAX(seq) + 1, 0) FROM repository_health WHERE repo_name = ?1 AND timestamp = ?2)
+    )
+"""
+
+_SQL_SELECT_HISTORY = f"""
+    SELECT {_SQL_HEALTH_COLUMNS}
+    FROM repository_health
+    WHERE repo_name = ? AND timestamp > ?
+    ORDER BY timestamp DESC, seq DESC
+"""
+
+# Multi-repository history: short name lists are bound inline, longer ones
+# go through a temp table to stay clear of SQLite's bound-parameter limit.
+# CROSS JOIN pins the temp table as the outer loop, so each name becomes a
+# primary-key range search already in output order
+_HISTORY_INLINE_LIMIT = 500
+
+_SQL_SELECT_HISTORIES = f"""
+    SELECT {_SQL_HEALTH_COLUMNS}
+    FROM repository_health
+    WHERE repo_name IN ({{placeholders}}) AND timestamp > ?
+    ORDER BY repo_name, timestamp DESC, seq DESC
+"""
+
+_SQL_CREATE_WANTED_REPOS = "CREATE TEMP TABLE IF NOT EXISTS wanted_repos (name TEXT PRIMARY KEY) WITHOUT ROWID"
+
+_SQL_SELECT_WANTED_HISTORIES = f"""
+    SELECT {_SQL_HEALTH_COLUMNS}
+    FROM wanted_repos
+    CROSS JOIN repository_health ON repo_name = wanted_repos.name
+    WHERE timestamp > ?
+    ORDER BY wanted_repos.name, timestamp DESC, seq DESC
+"""
+
+_SQL_LATEST_HEALTH = f"""
+    SELECT {_SQL_HEALTH_COLUMNS}
+    FROM repository_health
+    WHERE repo_name = ?
+    ORDER BY timestamp DESC, seq DESC
+    LIMIT 1
+"""
+
+_SQL_LATEST_ALL = f"""
+    SELECT {_SQL_HEALTH_COLUMNS}
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY repo_name ORDER BY timestamp DESC, seq DESC
+        ) AS recency
+        FROM repository_health
+    )
+    WHERE recency = 1
+    ORDER BY repo_name
+"""
+
+# Loose index scan: DISTINCT and GROUP BY both walk every row of the primary
+# key, whereas each recursive step here seeks straight to the next name, so
+# the cost scales with the number of repositories rather than snapshots
+_SQL_REPOSITORY_NAMES = """
+    WITH RECURSIVE repos(repo_name) AS (
+        SELECT MIN(repo_name) FROM repository_health
+        UNION ALL
+        SELECT (
+            SELECT repo_name FROM repository_health
+            WHERE repo_name > repos.repo_name
+            ORDER BY repo_name
+            LIMIT 1
+        )
+        FROM repos
+        WHERE repo_name IS NOT NULL
+    )
+    SELECT repo_name FROM repos WHERE repo_name IS NOT NULL
+"""
+
+# Retention deletes run in chunks so each transaction, and the WAL it
+# writes, stays bounded however much history has expired
+_PRUNE_CHUNK_SIZE = 10000
+
+_SQL_PRUNE = {
+    table: f"""
+    DELETE FROM {table}
+    WHERE (repo_name, timestamp) IN (
+        SELECT repo_name, timestamp FROM {table} WHERE timestamp < ? LIMIT {_PRUNE_CHUNK_SIZE}
+    )
+"""
+    for table in _TABLES
+}
+
+
 @dataclass
 class RepositoryHealth:
     """Repository health snapshot"""
@@ -32,122 +301,261 @@ class HealthDatabase:
     
     def __init__(self, db_path: str = "health_monitoring.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection used for every query on this database"""
+        # Autocommit mode; writes manage their own transactions via _transaction
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        
+        # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+        # only syncs at checkpoints instead of on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        
+        # Rows are read by column name rather than position
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    @contextmanager
+    def _transaction(self):
+        """Run statements on the shared connection inside a single transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+                # Inside the try: a failed COMMIT (e.g. SQLITE_BUSY) must not
+                # leave the shared connection in an open transaction
+                self._conn.execute("COMMIT")
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+    
     def _init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS repository_health (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    repo_name TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    overall_score REAL NOT NULL,
-                    compliance_level TEXT NOT NULL,
-                    health_grade TEXT NOT NULL,
-                    structural_health REAL,
-                    content_health REAL,
-                    process_health REAL,
-                    security_health REAL,
-                    evolution_health REAL,
-                    violations_count INTEGER,
-                    trend TEXT,
-                    raw_data TEXT
-                );
-                
-                CREATE TABLE IF NOT EXISTS validation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    repo_name TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    violation_type TEXT NOT NULL,
-                    violation_message TEXT NOT NULL,
-                    severity TEXT NOT NULL
-                );
-                
-                CREATE TABLE IF NOT EXISTS remediation_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    repo_name TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    action_type TEXT NOT NULL,
-                    action_description TEXT NOT NULL,
-                    safety_level TEXT NOT NULL,
-                    success BOOLEAN NOT NULL
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_repo_timestamp ON repository_health(repo_name, timestamp);
-                CREATE INDEX IF NOT EXISTS idx_violation_repo ON validation_history(repo_name, timestamp);
-                CREATE INDEX IF NOT EXISTS idx_remediation_repo ON remediation_history(repo_name, timestamp);
-            """)
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < _SCHEMA_VERSION and self._existing_tables():
+                self._migrate(version)
+            
+            self._conn.executescript(_SQL_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
+    def _existing_tables(self) -> List[str]:
+        """Names of the tracking tables already present in the database"""
+        rows = self._conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(_TABLES))})",
+            _TABLES
+        )
+        return [row["name"] for row in rows]
+    
+    def _migration_columns(self, table: str, from_version: int) -> Dict[str, str]:
+        """
+        Map each current-layout column to the SELECT expression that reads it
+        from the same table as written by schema version ``from_version``
+        """
+        columns = {
+            row["name"]: row["name"]
+            for row in self._conn.execute(f"PRAGMA table_info({table})")
+        }
+        
+        # v1: ISO-8601 TEXT timestamps became INTEGER epoch microseconds
+        if from_version < 1:
+            columns["timestamp"] = "iso_to_epoch_us(timestamp)"
+        
+        # v2: surrogate id keys dropped in favour of WITHOUT ROWID natural keys
+        if from_version < 2:
+            columns.pop("id", None)
+        
+        # v3: raw_data JSON TEXT became a codec-tagged compressed BLOB
+        if from_version < 3 and "raw_data" in columns:
+            columns["raw_data"] = "compress_raw_text(raw_data)"
+        
+        # v4: the five per-category REAL columns became one packed BLOB
+        if from_version < 4 and table == "repository_health":
+            for name in _CATEGORY_NAMES:
+                columns.pop(name, None)
+            columns["category_scores"] = f"pack_category_scores({', '.join(_CATEGORY_NAMES)})"
+        
+        # v5: seq tiebreak added to the natural keys. Since v2 the keys were
+        # unique, so every row takes seq 0; older tables can repeat a key and
+        # number the repeats in insertion order so none are dropped
+        if from_version < 2:
+            key = ", ".join(columns[name] for name in _TABLE_KEYS[table])
+            columns["seq"] = f"ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY rowid) - 1"
+        elif from_version < 5:
+            columns["seq"] = "0"
+        
+        return columns
+    
+    def _migrate(self, from_version: int):
+        """Rebuild tables written by an older schema version into the current layout"""
+        self._conn.create_function("iso_to_epoch_us", 1, _iso_to_epoch_us, deterministic=True)
+        self._conn.create_function("compress_raw_text", 1, _compress_raw_text, deterministic=True)
+        self._conn.create_function("pack_category_scores", len(_CATEGORY_NAMES), _pack_category_scores, deterministic=True)
+        
+        tables = self._existing_tables()
+        copies = {table: self._migration_columns(table, from_version) for table in tables}
+        indexes = [
+            row["name"] for row in self._conn.execute(
+                f"SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+                f"AND tbl_name IN ({', '.join('?' * len(tables))})",
+                tables
+            )
+        ]
+        
+        # Move the old tables aside, create the current schema, copy every
+        # row across and drop the originals - all in one transaction. The
+        # copy is a plain INSERT, so a key collision aborts the migration and
+        # leaves the database untouched rather than dropping history
+        script = ["BEGIN;"]
+        script.extend(f"DROP INDEX {index};" for index in indexes)
+        script.extend(f"ALTER TABLE {table} RENAME TO {table}_legacy;" for table in tables)
+        script.append(_SQL_SCHEMA)
+        for table, columns in copies.items():
+            script.append(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(columns.values())} FROM {table}_legacy;"
+            )
+        script.extend(f"DROP TABLE {table}_legacy;" for table in tables)
+        script.append(f"PRAGMA user_version = {_SCHEMA_VERSION};")
+        script.append("COMMIT;")
+        
+        try:
+            self._conn.executescript("\n".join(script))
+        except sqlite3.Error:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
     
     def store_health_snapshot(self, health: RepositoryHealth, raw_data: Dict[str, Any]):
         """Store health snapshot in database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO repository_health (
-                    repo_name, timestamp, overall_score, compliance_level, health_grade,
-                    structural_health, content_health, process_health, security_health, evolution_health,
-                    violations_count, trend, raw_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                health.repo_name,
-                health.timestamp.isoformat(),
-                health.overall_score,
-                health.compliance_level,
-                health.health_grade,
-                health.category_scores.get("structural_health", 0.0),
-                health.category_scores.get("content_health", 0.0),
-                health.category_scores.get("process_health", 0.0),
-                health.category_scores.get("security_health", 0.0),
-                health.category_scores.get("evolution_health", 0.0),
-                health.violations_count,
-                health.trend,
-                json.dumps(raw_data)
-            ))
+        self.store_health_snapshots_bulk([(health, raw_data)])
+    
+    def store_health_snapshots_bulk(self, snapshots: List[Tuple[RepositoryHealth, Dict[str, Any]]]):
+        """
+        Store many health snapshots in one transaction.
+        
+        executemany binds one row's 9 parameters at a time, so batches of any
+        size stay well under SQLite's bound-parameter limit without chunking.
+        """
+        with self._transaction() as conn:
+            conn.executemany(_SQL_INSERT_HEALTH, [self._health_to_row(health, raw_data) for health, raw_data in snapshots])
+    
+    def _health_to_row(self, health: RepositoryHealth, raw_data: Dict[str, Any]) -> tuple:
+        """Build repository_health INSERT parameters from a health snapshot"""
+        return (
+            health.repo_name,
+            _to_epoch_us(health.timestamp),
+            health.overall_score,
+            health.compliance_level,
+            health.health_grade,
+            _CATEGORY_STRUCT.pack(*(health.category_scores.get(name, 0.0) for name in _CATEGORY_NAMES)),
+            health.violations_count,
+            health.trend,
+            encode_raw(raw_data)
+        )
+    
+    def _row_to_health(self, row: sqlite3.Row) -> RepositoryHealth:
+        """Build a health snapshot from a repository_health SELECT row"""
+        category_scores = dict(zip(_CATEGORY_NAMES, _CATEGORY_STRUCT.unpack(row["category_scores"])))
+        
+        timestamp = _from_epoch_us(row["timestamp"])
+        return RepositoryHealth(
+            repo_name=row["repo_name"],
+            timestamp=timestamp,
+            overall_score=row["overall_score"],
+            compliance_level=row["compliance_level"],
+            health_grade=row["health_grade"],
+            category_scores=category_scores,
+            violations_count=row["violations_count"],
+            trend=row["trend"],
+            last_updated=timestamp
+        )
     
     def get_repository_history(self, repo_name: str, days: int = 30) -> List[RepositoryHealth]:
         """Get repository health history"""
         cutoff = datetime.now() - timedelta(days=days)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT repo_name, timestamp, overall_score, compliance_level, health_grade,
-                       structural_health, content_health, process_health, security_health, evolution_health,
-                       violations_count, trend
-                FROM repository_health
-                WHERE repo_name = ? AND timestamp > ?
-                ORDER BY timestamp DESC
-            """, (repo_name, cutoff.isoformat()))
+        with self._lock:
+            cursor = self._conn.execute(_SQL_SELECT_HISTORY, (repo_name, _to_epoch_us(cutoff)))
             
-            results = []
-            for row in cursor.fetchall():
-                category_scores = {
-                    "structural_health": row[5],
-                    "content_health": row[6],
-                    "process_health": row[7],
-                    "security_health": row[8],
-                    "evolution_health": row[9]
-                }
-                
-                health = RepositoryHealth(
-                    repo_name=row[0],
-                    timestamp=datetime.fromisoformat(row[1]),
-                    overall_score=row[2],
-                    compliance_level=row[3],
-                    health_grade=row[4],
-                    category_scores=category_scores,
-                    violations_count=row[10],
-                    trend=row[11],
-                    last_updated=datetime.fromisoformat(row[1])
-                )
-                results.append(health)
+            return [self._row_to_health(row) for row in cursor]
+    
+    def get_histories(self, repo_names: List[str], days: int = 30) -> Dict[str, List[RepositoryHealth]]:
+        """Get the health history of many repositories in a single query"""
+        cutoff = _to_epoch_us(datetime.now() - timedelta(days=days))
+        histories = {repo_name: [] for repo_name in repo_names}
+        
+        if len(histories) <= _HISTORY_INLINE_LIMIT:
+            statement = _SQL_SELECT_HISTORIES.format(placeholders=", ".join("?" * len(histories)))
+            with self._lock:
+                rows = self._conn.execute(statement, (*histories, cutoff)).fetchall()
+        else:
+            with self._transaction() as conn:
+                conn.execute(_SQL_CREATE_WANTED_REPOS)
+                conn.execute("DELETE FROM wanted_repos")
+                conn.executemany("INSERT INTO wanted_repos VALUES (?)", ((name,) for name in histories))
+                rows = conn.execute(_SQL_SELECT_WANTED_HISTORIES, (cutoff,)).fetchall()
+        
+        for repo_name, group in itertools.groupby(rows, key=lambda row: row["repo_name"]):
+            histories[repo_name] = [self._row_to_health(row) for row in group]
+        
+        return histories
+    
+    def get_latest_health(self, repo_name: str) -> Optional[RepositoryHealth]:
+        """Get the most recent health snapshot for a repository"""
+        with self._lock:
+            row = self._conn.execute(_SQL_LATEST_HEALTH, (repo_name,)).fetchone()
+            return self._row_to_health(row) if row else None
+    
+    def get_latest_for_all(self) -> Dict[str, RepositoryHealth]:
+        """Get the latest health snapshot of every repository in a single query"""
+        with self._lock:
+            cursor = self._conn.execute(_SQL_LATEST_ALL)
             
-            return results
+            return {row["repo_name"]: self._row_to_health(row) for row in cursor}
     
     def get_all_repositories(self) -> List[str]:
         """Get list of all monitored repositories"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT DISTINCT repo_name FROM repository_health")
-            return [row[0] for row in cursor.fetchall()]
+        with self._lock:
+            cursor = self._conn.execute(_SQL_REPOSITORY_NAMES)
+            return [row["repo_name"] for row in cursor]
+    
+    def prune(self, days: int = 365, vacuum: bool = False) -> Dict[str, int]:
+        """Delete history older than ``days`` days, returning rows deleted per table"""
+        cutoff = _to_epoch_us(datetime.now() - timedelta(days=days))
+        deleted = {}
+        
+        for table, statement in _SQL_PRUNE.items():
+            deleted[table] = 0
+            while True:
+                with self._transaction() as conn:
+                    removed = conn.execute(statement, (cutoff,)).rowcount
+                deleted[table] += removed
+                if removed == 0:
+                    break
+        
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            if vacuum:
+                # Return the freed pages to the filesystem; rewrites the whole file
+                self._conn.execute("VACUUM")
+        
+        return deleted
 
 
 class HealthDashboard:
@@ -160,113 +568,133 @@ class HealthDashboard:
     
     def update_repository_health(self, repo_name: str, validation_result: Dict[str, Any]):
         """Update health data for a repository"""
-        # Extract health metrics
-        health = RepositoryHealth(
+        return self.update_repositories_bulk([(repo_name, validation_result)])[0]
+    
+    def update_repositories_bulk(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[RepositoryHealth]:
+        """Update health data for many repositories in a single transaction"""
+        snapshots = [
+            (self._build_health(repo_name, validation_result), validation_result)
+            for repo_name, validation_result in items
+        ]
+        
+        # Store in database
+        self.db.store_health_snapshots_bulk(snapshots)
+        
+        return [health for health, _ in snapshots]
+    
+    def _build_health(self, repo_name: str, validation_result: Dict[str, Any]) -> RepositoryHealth:
+        """Extract a health snapshot from a validation result"""
+        now = datetime.now()
+        return RepositoryHealth(
             repo_name=repo_name,
-            timestamp=datetime.now(),
+            timestamp=now,
             overall_score=validation_result.get("score", 0.0),
             compliance_level=validation_result.get("compliance_level", "basic"),
             health_grade=validation_result.get("health_grade", "F"),
             category_scores=validation_result.get("health_metrics", {}),
             violations_count=len(validation_result.get("violations", [])),
             trend=validation_result.get("trend", "stable"),
-            last_updated=datetime.now()
+            last_updated=now
         )
-        
-        # Store in database
-        self.db.store_health_snapshot(health, validation_result)
-        
-        return health
     
     def generate_dashboard_report(self, format_type: str = "markdown") -> str:
         """Generate comprehensive dashboard report"""
-        repositories = self.db.get_all_repositories()
+        # Fetch every repository's latest snapshot once and share it across
+        # all report sections instead of querying per repository per section.
+        # A single primary-key scan is cheaper than fanning per-repository
+        # lookups out to worker threads, which would also serialize on the
+        # shared connection's lock.
+        latest_health = self.db.get_latest_for_all()
+        repositories = list(latest_health)
         
         if format_type == "markdown":
-            return self._generate_markdown_dashboard(repositories)
+            return self._generate_markdown_dashboard(repositories, latest_health)
         elif format_type == "html":
-            return self._generate_html_dashboard(repositories)
+            return self._generate_html_dashboard(repositories, latest_health)
         else:
-            return self._generate_text_dashboard(repositories)
+            return self._generate_text_dashboard(repositories, latest_health)
     
-    def _generate_markdown_dashboard(self, repositories: List[str]) -> str:
+    def _generate_markdown_dashboard(self, repositories: List[str],
+                                     latest_health: Dict[str, RepositoryHealth]) -> str:
         """Generate markdown dashboard"""
-        report = []
-        report.append("# FCM Repository Health Dashboard")
-        report.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        report.append("")
+        # Sections open with their own blank separator line, so the report
+        # streams straight into one buffer without an intermediate line list
+        buf = io.StringIO()
+        w = buf.write
+        w("# FCM Repository Health Dashboard\n")
+        w(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
         
         # Overall summary
-        summary = self._calculate_summary_stats(repositories)
-        report.append("## 📊 Organization Summary")
-        report.append("")
-        report.append(f"- **Total Repositories:** {summary['total_repos']}")
-        report.append(f"- **Average Health Score:** {summary['avg_score']:.2f}")
-        report.append(f"- **Healthy Repositories:** {summary['healthy_count']}/{summary['total_repos']}")
-        report.append(f"- **Critical Issues:** {summary['critical_count']}")
-        report.append("")
+        summary = self._calculate_summary_stats(repositories, latest_health)
+        w("\n## 📊 Organization Summary\n\n")
+        w(f"- **Total Repositories:** {summary['total_repos']}\n")
+        w(f"- **Average Health Score:** {summary['avg_score']:.2f}\n")
+        w(f"- **Healthy Repositories:** {summary['healthy_count']}/{summary['total_repos']}\n")
+        w(f"- **Critical Issues:** {summary['critical_count']}\n")
         
         # Health distribution
-        report.append("## 🎯 Compliance Distribution")
-        report.append("")
-        report.append("| Level | Count | Percentage |")
-        report.append("|-------|-------|------------|")
+        w("\n## 🎯 Compliance Distribution\n\n")
+        w("| Level | Count | Percentage |\n")
+        w("|-------|-------|------------|\n")
         for level, count in summary['compliance_distribution'].items():
             percentage = (count / summary['total_repos'] * 100) if summary['total_repos'] > 0 else 0
-            report.append(f"| {level.title()} | {count} | {percentage:.1f}% |")
-        report.append("")
+            w(_MD_DISTRIBUTION_ROW.format(level=level.title(), count=count, percentage=percentage))
         
         # Repository details
-        report.append("## 📁 Repository Details")
-        report.append("")
-        report.append("| Repository | Score | Grade | Level | Trend | Issues |")
-        report.append("|------------|-------|-------|-------|-------|--------|")
+        w("\n## 📁 Repository Details\n\n")
+        w("| Repository | Score | Grade | Level | Trend | Issues |\n")
+        w("|------------|-------|-------|-------|-------|--------|\n")
         
         for repo_name in repositories:
-            latest = self._get_latest_health(repo_name)
+            latest = latest_health.get(repo_name)
             if latest:
-                trend_emoji = {"improving": "📈", "stable": "➡️", "declining": "📉"}.get(latest.trend, "➡️")
-                report.append(f"| {repo_name} | {latest.overall_score:.2f} | {latest.health_grade} | {latest.compliance_level} | {trend_emoji} | {latest.violations_count} |")
-        
-        report.append("")
+                w(_MD_REPOSITORY_ROW.format(name=repo_name, health=latest, trend=_TREND_EMOJI.get(latest.trend, "➡️")))
         
         # Critical issues
-        critical_repos = [repo for repo in repositories if self._get_latest_health(repo) and self._get_latest_health(repo).overall_score < 0.4]
+        critical_repos = [
+            (repo_name, latest_health[repo_name])
+            for repo_name in repositories
+            if repo_name in latest_health and latest_health[repo_name].overall_score < 0.4
+        ]
         if critical_repos:
-            report.append("## 🚨 Critical Issues")
-            report.append("")
-            for repo_name in critical_repos:
-                latest = self._get_latest_health(repo_name)
-                report.append(f"- **{repo_name}**: Score {latest.overall_score:.2f} - {latest.violations_count} violations")
-            report.append("")
+            w("\n## 🚨 Critical Issues\n\n")
+            for repo_name, latest in critical_repos:
+                w(_MD_CRITICAL_ROW.format(name=repo_name, health=latest))
         
         # Trends analysis
-        report.append("## 📈 Trend Analysis")
-        report.append("")
-        trend_summary = self._analyze_trends(repositories)
+        w("\n## 📈 Trend Analysis\n")
+        trend_summary = self._analyze_trends(repositories, latest_health)
         for trend_type, repos in trend_summary.items():
             if repos:
-                emoji = {"improving": "📈", "stable": "➡️", "declining": "📉"}.get(trend_type, "➡️")
-                report.append(f"### {emoji} {trend_type.title()} ({len(repos)} repositories)")
+                emoji = _TREND_EMOJI.get(trend_type, "➡️")
+                w(f"\n### {emoji} {trend_type.title()} ({len(repos)} repositories)\n")
                 for repo in repos:
-                    report.append(f"- {repo}")
-                report.append("")
+                    w(f"- {repo}\n")
         
         # Recommendations
-        recommendations = self._generate_organizational_recommendations(repositories)
+        recommendations = self._generate_organizational_recommendations(summary)
         if recommendations:
-            report.append("## 💡 Organizational Recommendations")
-            report.append("")
+            w("\n## 💡 Organizational Recommendations\n\n")
             for rec in recommendations:
-                report.append(f"- {rec}")
-            report.append("")
+                w(f"- {rec}\n")
         
-        return "\n".join(report)
+        return buf.getvalue()
     
-    def _generate_html_dashboard(self, repositories: List[str]) -> str:
+    def _generate_html_dashboard(self, repositories: List[str],
+                                 latest_health: Dict[str, RepositoryHealth]) -> str:
         """Generate HTML dashboard with charts"""
         # Basic HTML dashboard - could be enhanced with proper charting
-        summary = self._calculate_summary_stats(repositories)
+        summary = self._calculate_summary_stats(repositories, latest_health)
+        bisect_right = bisect.bisect_right
+        rows = "".join(
+            _HTML_REPOSITORY_ROW.format(
+                row_class=_ROW_CLASS_LABELS[bisect_right(_ROW_CLASS_THRESHOLDS, latest.overall_score)],
+                name=repo_name,
+                health=latest
+            )
+            for repo_name in repositories
+            if (latest := latest_health.get(repo_name))
+        )
         
         html = f"""
         <!DOCTYPE html>
@@ -315,24 +743,7 @@ class HealthDashboard:
                     <th>Trend</th>
                     <th>Issues</th>
                 </tr>
-        """
-        
-        for repo_name in repositories:
-            latest = self._get_latest_health(repo_name)
-            if latest:
-                row_class = "critical" if latest.overall_score < 0.4 else "good" if latest.overall_score > 0.8 else ""
-                html += f"""
-                <tr class="{row_class}">
-                    <td>{repo_name}</td>
-                    <td>{latest.overall_score:.2f}</td>
-                    <td>{latest.health_grade}</td>
-                    <td>{latest.compliance_level}</td>
-                    <td>{latest.trend}</td>
-                    <td>{latest.violations_count}</td>
-                </tr>
-                """
-        
-        html += """
+        {rows}
             </table>
         </body>
         </html>
@@ -342,29 +753,22 @@ class HealthDashboard:
     
     def _get_latest_health(self, repo_name: str) -> Optional[RepositoryHealth]:
         """Get latest health snapshot for repository"""
-        history = self.db.get_repository_history(repo_name, days=1)
-        return history[0] if history else None
+        return self.db.get_latest_health(repo_name)
     
-    def _calculate_summary_stats(self, repositories: List[str]) -> Dict[str, Any]:
+    def _calculate_summary_stats(self, repositories: List[str],
+                                 latest_health: Dict[str, RepositoryHealth]) -> Dict[str, Any]:
         """Calculate organization-wide summary statistics"""
         total_repos = len(repositories)
-        scores = []
-        compliance_levels = {"basic": 0, "structured": 0, "documented": 0, "tested": 0, "secure": 0, "exemplary": 0}
-        critical_count = 0
-        healthy_count = 0
+        snapshots = [latest_health[repo_name] for repo_name in repositories if repo_name in latest_health]
+        scores = [latest.overall_score for latest in snapshots]
         
-        for repo_name in repositories:
-            latest = self._get_latest_health(repo_name)
-            if latest:
-                scores.append(latest.overall_score)
-                compliance_levels[latest.compliance_level] = compliance_levels.get(latest.compliance_level, 0) + 1
-                
-                if latest.overall_score < 0.4:
-                    critical_count += 1
-                elif latest.overall_score > 0.7:
-                    healthy_count += 1
+        # Known levels keep their fixed order; unexpected ones follow as first seen
+        compliance_levels = dict.fromkeys(_COMPLIANCE_LEVELS, 0)
+        compliance_levels.update(Counter(latest.compliance_level for latest in snapshots))
         
-        avg_score = sum(scores) / len(scores) if scores else 0.0
+        critical_count = sum(1 for score in scores if score < 0.4)
+        healthy_count = sum(1 for score in scores if score > 0.7)
+        avg_score = fmean(scores) if scores else 0.0
         
         return {
             "total_repos": total_repos,
@@ -374,21 +778,21 @@ class HealthDashboard:
             "compliance_distribution": compliance_levels
         }
     
-    def _analyze_trends(self, repositories: List[str]) -> Dict[str, List[str]]:
+    def _analyze_trends(self, repositories: List[str],
+                        latest_health: Dict[str, RepositoryHealth]) -> Dict[str, List[str]]:
         """Analyze trends across repositories"""
         trends = {"improving": [], "stable": [], "declining": []}
         
         for repo_name in repositories:
-            latest = self._get_latest_health(repo_name)
+            latest = latest_health.get(repo_name)
             if latest:
                 trends[latest.trend].append(repo_name)
         
         return trends
     
-    def _generate_organizational_recommendations(self, repositories: List[str]) -> List[str]:
-        """Generate organization-level recommendations"""
+    def _generate_organizational_recommendations(self, summary: Dict[str, Any]) -> List[str]:
+        """Generate organization-level recommendations from the summary statistics"""
         recommendations = []
-        summary = self._calculate_summary_stats(repositories)
         
         # Critical issues
         if summary["critical_count"] > 0:
@@ -455,11 +859,13 @@ class HealthDashboard:
 def main():
     """CLI interface for health dashboard"""
     parser = argparse.ArgumentParser(description="FCM Repository Health Dashboard")
-    parser.add_argument("--action", choices=["update", "dashboard", "repository"], required=True)
+    parser.add_argument("--action", choices=["update", "dashboard", "repository", "prune"], required=True)
     parser.add_argument("--repo-name", help="Repository name for update/repository actions")
     parser.add_argument("--validation-result", help="Path to validation result JSON")
     parser.add_argument("--format", choices=["markdown", "html", "text"], default="markdown")
-    parser.add_argument("--days", type=int, default=30, help="Number of days for historical data")
+    parser.add_argument("--days", type=int,
+                        help="Number of days for historical data (default 30), or of history to keep when pruning (default 365)")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM the database after pruning")
     parser.add_argument("--output", help="Output file path")
     
     args = parser.parse_args()
@@ -492,7 +898,7 @@ def main():
             print("Error: --repo-name required for repository action")
             return
         
-        report = dashboard.generate_repository_report(args.repo_name, args.days)
+        report = dashboard.generate_repository_report(args.repo_name, 30 if args.days is None else args.days)
         
         if args.output:
             with open(args.output, 'w') as f:
@@ -500,6 +906,11 @@ def main():
             print(f"Repository report saved to: {args.output}")
         else:
             print(report)
+    
+    elif args.action == "prune":
+        deleted = dashboard.db.prune(365 if args.days is None else args.days, args.vacuum)
+        for table, count in deleted.items():
+            print(f"Pruned {count} rows from {table}")
 
 
 if __name__ == "__main__":
@@ -4,16 +4,86 @@ FCM Repository Auto-Remediation Tool
 Implementation of Layer 4 automated remediation from the GitHub Repository Model
 """
 
+import io
 import os
+import re
 import json
 import shutil
+import importlib.util
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Type
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import argparse
 
+if TYPE_CHECKING:
+    from ..validators.repo_validator import FCMRepositoryValidator
 
-@dataclass
+
+# Template placeholders are substituted in a single regex pass; other braces
+# (the JSON in the manifest template) are left untouched
+_TEMPLATE_VAR_RE = re.compile(r"\{(repository_name|repository_type|organization|year|date)\}")
+
+# Violation dispatch: one anchored match whose alternatives are tried in rule
+# precedence order, so the first rule whose keywords all appear anywhere in
+# the message wins. The empty trailing group names the handler (``lastgroup``)
+# and the directory/file groups capture the text after the last ": "
+_VIOLATION_RE = re.compile(r"""
+    (?=.*?Missing\ required\ directory)(?=(?:.*:\ )?(?P<directory>.*))(?P<missing_directory>)
+  | (?=.*?Missing\ required\ file)(?=(?:.*:\ )?(?P<file>.*))(?P<missing_file>)
+  | (?=.*?README\.md)(?=.*?too\ short)(?P<short_readme>)
+  | (?=.*?manifest)(?=.*?missing)(?P<missing_manifest>)
+  | (?=.*?naming\ convention)(?P<naming_convention>)
+  | (?=.*?security\ policy)(?P<security_policy>)
+  | (?=.*?dependency\ scanning)(?P<dependency_scanning>)
+""", re.DOTALL | re.VERBOSE)
+
+_SAFETY_LEVELS = ("safe", "caution", "risky")
+
+# Safety levels each execute_plan safety filter lets through
+_ALLOWED_LEVELS = {
+    "safe": frozenset({"safe"}),
+    "caution": frozenset({"safe", "caution"}),
+    "risky": frozenset(_SAFETY_LEVELS)
+}
+
+# Estimated minutes per action type; unlisted types take no time
+_ACTION_MINUTES = {
+    "create_file": 2,
+    "create_directory": 1,
+    "fix_content": 5,
+    "rename": 3
+}
+
+# Major directories get a README when they are created
+_MAJOR_DIRS = frozenset({"core", "composite", "bridges", "analytical", "empirical"})
+
+# Marker directories probed in order by _detect_repository_type
+_REPOSITORY_TYPE_MARKERS = (
+    ("core", "framework"),
+    ("analytical", "systems"),
+    ("empirical", "systems"),
+    ("experiments", "lab")
+)
+
+
+@lru_cache(maxsize=None)
+def _render(template: str, repository_name: str, repository_type: str,
+            organization: str, year: str, date: str) -> str:
+    """Substitute template variables, memoized on the template and its variables"""
+    variables = {
+        "repository_name": repository_name,
+        "repository_type": repository_type,
+        "organization": organization,
+        "year": year,
+        "date": date
+    }
+    return _TEMPLATE_VAR_RE.sub(lambda match: variables[match.group(1)], template)
+
+
+@dataclass(slots=True, frozen=True)
 class RemediationAction:
     """Single remediation action"""
     action_type: str  # create_file, create_directory, fix_content, rename, etc.
@@ -24,7 +94,7 @@ class RemediationAction:
     backup_needed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RemediationPlan:
     """Complete remediation plan"""
     actions: List[RemediationAction]
@@ -32,6 +102,7 @@ class RemediationPlan:
     estimated_time: str
     prerequisites: List[str]
     warnings: List[str]
+    actions_by_safety: Dict[str, List[RemediationAction]] = field(default_factory=dict)
 
 
 class FCMAutoRemediation:
@@ -45,6 +116,15 @@ class FCMAutoRemediation:
         self.safe_mode = safe_mode
         self.backup_dir = self.repo_path / ".remediation_backups"
         self.templates = self._load_templates()
+        self.repository_type = self._detect_repository_type()
+        self._ensured_dirs = set()
+        self._repo_root = str(self.repo_path)
+        self._active_backup_dir = None
+        
+        # Template dates are fixed for the lifetime of the instance
+        today = date.today()
+        self._year = str(today.year)
+        self._iso_date = today.isoformat()
     
     def _load_templates(self) -> Dict[str, str]:
         """Load file templates for creation"""
@@ -169,8 +249,7 @@ updates:
         actions = []
         
         for violation in violations:
-            remediation_actions = self._create_actions_for_violation(violation)
-            actions.extend(remediation_actions)
+            actions.extend(self._create_actions_for_violation(violation))
         
         # Create plan
         plan = RemediationPlan(
@@ -178,170 +257,173 @@ updates:
             safety_summary=self._analyze_safety(actions),
             estimated_time=self._estimate_time(actions),
             prerequisites=self._check_prerequisites(),
-            warnings=self._generate_warnings(actions)
+            warnings=self._generate_warnings(actions),
+            actions_by_safety=self._partition_by_safety(actions)
         )
         
         return plan
     
     def _create_actions_for_violation(self, violation: str) -> List[RemediationAction]:
         """Create specific remediation actions for a violation"""
-        actions = []
+        match = _VIOLATION_RE.match(violation)
+        if not match:
+            return []
         
-        if "Missing required directory" in violation:
-            dir_name = violation.split(": ")[-1]
-            actions.append(RemediationAction(
-                action_type="create_directory",
-                description=f"Create required directory: {dir_name}",
-                target_path=dir_name,
-                safety_level="safe"
-            ))
-            
-            # Add README to directory if it's a major directory
-            if dir_name in ["core", "composite", "bridges", "analytical", "empirical"]:
-                readme_path = f"{dir_name}/README.md"
-                actions.append(RemediationAction(
-                    action_type="create_file",
-                    description=f"Create directory README: {readme_path}",
-                    target_path=readme_path,
-                    safety_level="safe",
-                    content=f"# {dir_name.title()}\n\nContent for {dir_name} directory.\n"
-                ))
-        
-        elif "Missing required file" in violation:
-            file_name = violation.split(": ")[-1]
-            
-            if file_name in self.templates:
-                actions.append(RemediationAction(
-                    action_type="create_file",
-                    description=f"Create required file: {file_name}",
-                    target_path=file_name,
-                    safety_level="safe",
-                    content=self._render_template(file_name)
-                ))
-            else:
-                actions.append(RemediationAction(
-                    action_type="create_file",
-                    description=f"Create required file: {file_name}",
-                    target_path=file_name,
-                    safety_level="caution",
-                    content=f"# {file_name}\n\nGenerated file - please customize.\n"
-                ))
-        
-        elif "README.md" in violation and "too short" in violation:
-            actions.append(RemediationAction(
-                action_type="fix_content",
-                description="Expand README.md content",
-                target_path="README.md",
-                safety_level="caution",
-                backup_needed=True,
-                content=self._render_template("README.md")
-            ))
-        
-        elif "manifest" in violation and "missing" in violation:
+        return getattr(self, f"_actions_for_{match.lastgroup}")(match)
+    
+    def _actions_for_missing_directory(self, match: re.Match) -> List[RemediationAction]:
+        """Create a missing required directory"""
+        dir_name = match.group("directory")
+        actions = [RemediationAction(
+            action_type="create_directory",
+            description=f"Create required directory: {dir_name}",
+            target_path=dir_name,
+            safety_level="safe"
+        )]
+        
+        # Add README to directory if it's a major directory
+        if dir_name in _MAJOR_DIRS:
+            readme_path = f"{dir_name}/README.md"
             actions.append(RemediationAction(
                 action_type="create_file",
-                description="Create FCM manifest file",
-                target_path="fcm.manifest.json",
+                description=f"Create directory README: {readme_path}",
+                target_path=readme_path,
                 safety_level="safe",
-                content=self._render_template("fcm.manifest.json")
+                content=f"# {dir_name.title()}\n\nContent for {dir_name} directory.\n"
             ))
         
-        elif "naming convention" in violation:
-            # Extract the problematic file/directory name
-            if "Model file" in violation:
-                # Handle FCM model naming issues
-                actions.append(RemediationAction(
-                    action_type="rename",
-                    description="Fix FCM model file naming",
-                    target_path="",  # Would need to extract specific file
-                    safety_level="risky",
-                    backup_needed=True
-                ))
+        return actions
+    
+    def _actions_for_missing_file(self, match: re.Match) -> List[RemediationAction]:
+        """Create a missing required file, from its template when one exists"""
+        file_name = match.group("file")
         
-        elif "security policy" in violation:
-            actions.append(RemediationAction(
+        if file_name in self.templates:
+            return [RemediationAction(
                 action_type="create_file",
-                description="Create security policy",
-                target_path="SECURITY.md",
+                description=f"Create required file: {file_name}",
+                target_path=file_name,
                 safety_level="safe",
-                content=self.templates["SECURITY.md"]
-            ))
-        
-        elif "dependency scanning" in violation:
-            actions.append(RemediationAction(
+                content=self._render_template(file_name)
+            )]
+        
+        return [RemediationAction(
+            action_type="create_file",
+            description=f"Create required file: {file_name}",
+            target_path=file_name,
+            safety_level="caution",
+            content=f"# {file_name}\n\nGenerated file - please customize.\n"
+        )]
+    
+    def _actions_for_short_readme(self, match: re.Match) -> List[RemediationAction]:
+        """Replace a too-short README with the template"""
+        return [RemediationAction(
+            action_type="fix_content",
+            description="Expand README.md content",
+            target_path="README.md",
+            safety_level="caution",
+            backup_needed=True,
+            content=self._render_template("README.md")
+        )]
+    
+    def _actions_for_missing_manifest(self, match: re.Match) -> List[RemediationAction]:
+        """Create the FCM manifest"""
+        return [RemediationAction(
+            action_type="create_file",
+            description="Create FCM manifest file",
+            target_path="fcm.manifest.json",
+            safety_level="safe",
+            content=self._render_template("fcm.manifest.json")
+        )]
+    
+    def _actions_for_naming_convention(self, match: re.Match) -> List[RemediationAction]:
+        """Rename files that break the naming conventions"""
+        # Extract the problematic file/directory name
+        if "Model file" not in match.string:
+            return []
+        
+        # Handle FCM model naming issues
+        return [RemediationAction(
+            action_type="rename",
+            description="Fix FCM model file naming",
+            target_path="",  # Would need to extract specific file
+            safety_level="risky",
+            backup_needed=True
+        )]
+    
+    def _actions_for_security_policy(self, match: re.Match) -> List[RemediationAction]:
+        """Create the security policy"""
+        return [RemediationAction(
+            action_type="create_file",
+            description="Create security policy",
+            target_path="SECURITY.md",
+            safety_level="safe",
+            content=self.templates["SECURITY.md"]
+        )]
+    
+    def _actions_for_dependency_scanning(self, match: re.Match) -> List[RemediationAction]:
+        """Set up Dependabot, creating the .github directory first"""
+        return [
+            RemediationAction(
+                action_type="create_directory",
+                description="Create .github directory",
+                target_path=".github",
+                safety_level="safe"
+            ),
+            RemediationAction(
                 action_type="create_file",
                 description="Setup dependency scanning",
                 target_path=".github/dependabot.yml",
                 safety_level="safe",
                 content=self.templates[".github/dependabot.yml"]
-            ))
-            
-            # Ensure .github directory exists
-            actions.insert(-1, RemediationAction(
-                action_type="create_directory",
-                description="Create .github directory",
-                target_path=".github",
-                safety_level="safe"
-            ))
-        
-        return actions
+            )
+        ]
     
     def _render_template(self, template_name: str) -> str:
         """Render template with repository-specific variables"""
-        template = self.templates.get(template_name, "")
-        
-        # Get repository info
-        repo_name = self.repo_path.name
-        repo_type = self._detect_repository_type()
-        
-        # Template variables
-        variables = {
-            "repository_name": repo_name,
-            "repository_type": repo_type,
-            "organization": "FCM Organization",  # Could be detected from git config
-            "year": str(datetime.now().year),
-            "date": datetime.now().isoformat()[:10]
-        }
-        
-        # Replace variables
-        for var, value in variables.items():
-            template = template.replace(f"{{{var}}}", value)
-        
-        return template
+        return _render(
+            self.templates.get(template_name, ""),
+            repository_name=self.repo_path.name,
+            repository_type=self.repository_type,
+            organization="FCM Organization",  # Could be detected from git config
+            year=self._year,
+            date=self._iso_date
+        )
     
     def _detect_repository_type(self) -> str:
         """Detect repository type from structure"""
-        if (self.repo_path / "core").exists():
-            return "framework"
-        elif (self.repo_path / "analytical").exists() or (self.repo_path / "empirical").exists():
-            return "systems"
-        elif (self.repo_path / "experiments").exists():
-            return "lab"
-        else:
-            return "personal"
+        # One directory listing instead of a stat() per marker
+        try:
+            with os.scandir(self.repo_path) as entries:
+                top_dirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            top_dirs = set()
+        
+        for marker, repository_type in _REPOSITORY_TYPE_MARKERS:
+            if marker in top_dirs:
+                return repository_type
+        
+        return "personal"
     
     def _analyze_safety(self, actions: List[RemediationAction]) -> Dict[str, int]:
         """Analyze safety levels of all actions"""
-        safety_counts = {"safe": 0, "caution": 0, "risky": 0}
-        
+        safety_counts = Counter(action.safety_level for action in actions)
+        return {level: safety_counts[level] for level in _SAFETY_LEVELS}
+    
+    def _partition_by_safety(self, actions: List[RemediationAction]) -> Dict[str, List[RemediationAction]]:
+        """Group actions by safety level, keeping their plan order"""
+        actions_by_safety = {level: [] for level in _SAFETY_LEVELS}
         for action in actions:
-            safety_counts[action.safety_level] += 1
-        
-        return safety_counts
+            actions_by_safety.setdefault(action.safety_level, []).append(action)
+        return actions_by_safety
     
     def _estimate_time(self, actions: List[RemediationAction]) -> str:
         """Estimate time required for all actions"""
-        total_minutes = 0
-        
-        for action in actions:
-            if action.action_type == "create_file":
-                total_minutes += 2
-            elif action.action_type == "create_directory":
-                total_minutes += 1
-            elif action.action_type == "fix_content":
-                total_minutes += 5
-            elif action.action_type == "rename":
-                total_minutes += 3
+        action_counts = Counter(action.action_type for action in actions)
+        total_minutes = sum(
+            _ACTION_MINUTES.get(action_type, 0) * count
+            for action_type, count in action_counts.items()
+        )
         
         if total_minutes < 5:
             return "< 5 minutes"
@@ -356,12 +438,14 @@ updates:
         """Check prerequisites for remediation"""
         prerequisites = []
         
-        # Check if in git repository
-        if not (self.repo_path / ".git").exists():
+        # Check if in git repository (.git is a file in worktrees and submodules)
+        if not os.path.lexists(os.path.join(self._repo_root, ".git")):
             prerequisites.append("Repository must be a Git repository")
         
-        # Check write permissions
-        if not os.access(self.repo_path, os.W_OK):
+        # Check write permissions. access() stays: reimplementing it from
+        # stat() mode bits would misjudge root, group membership, ACLs and
+        # read-only mounts
+        if not os.access(self._repo_root, os.W_OK):
             prerequisites.append("Write permissions required for repository")
         
         return prerequisites
@@ -370,13 +454,17 @@ updates:
         """Generate warnings about remediation actions"""
         warnings = []
         
-        risky_actions = [a for a in actions if a.safety_level == "risky"]
-        if risky_actions:
-            warnings.append(f"{len(risky_actions)} risky action(s) require manual review")
+        risky_count = 0
+        backup_count = 0
+        for action in actions:
+            risky_count += action.safety_level == "risky"
+            backup_count += action.backup_needed
+        
+        if risky_count:
+            warnings.append(f"{risky_count} risky action(s) require manual review")
         
-        backup_actions = [a for a in actions if a.backup_needed]
-        if backup_actions:
-            warnings.append(f"{len(backup_actions)} action(s) will modify existing files")
+        if backup_count:
+            warnings.append(f"{backup_count} action(s) will modify existing files")
         
         return warnings
     
@@ -389,19 +477,18 @@ updates:
             "total_actions": len(plan.actions)
         }
         
-        # Create backup directory if needed
-        backup_actions = [a for a in plan.actions if a.backup_needed]
-        if backup_actions:
-            self._create_backup_directory()
+        # Directories may have changed since the last run
+        self._ensured_dirs.clear()
         
-        # Filter actions by safety level
-        if safety_filter == "safe":
-            allowed_levels = ["safe"]
-        elif safety_filter == "caution":
-            allowed_levels = ["safe", "caution"]
-        else:  # "risky"
-            allowed_levels = ["safe", "caution", "risky"]
+        # Create this run's backup directory up front if anything needs backing up
+        backup_needed = any(a.backup_needed for a in plan.actions)
+        self._active_backup_dir = self._create_backup_directory() if backup_needed else None
         
+        # Filter actions by safety level; anything unrecognised allows every level
+        allowed_levels = _ALLOWED_LEVELS.get(safety_filter, _ALLOWED_LEVELS["risky"])
+        
+        # Actions run in plan order rather than bucket by bucket, since later
+        # actions can depend on earlier ones of a different safety level
         for action in plan.actions:
             if action.safety_level not in allowed_levels:
                 results["skipped"].append({
@@ -423,29 +510,35 @@ updates:
     
     def _execute_action(self, action: RemediationAction):
         """Execute a single remediation action"""
-        target_path = self.repo_path / action.target_path
+        # Plain string paths: this runs once per action, and os.path avoids
+        # building a pathlib object for every join, parent and existence check
+        target_path = os.path.join(self._repo_root, action.target_path)
         
         if action.action_type == "create_directory":
-            target_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(target_path)
         
         elif action.action_type == "create_file":
             # Create parent directories if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Don't overwrite existing files unless explicitly allowed
-            if target_path.exists() and not action.backup_needed:
-                raise FileExistsError(f"File already exists: {target_path}")
+            self._ensure_directory(os.path.dirname(target_path))
             
-            # Create backup if needed
-            if target_path.exists() and action.backup_needed:
-                self._create_backup(target_path)
-            
-            # Write content
-            with open(target_path, 'w') as f:
-                f.write(action.content or "")
+            if action.backup_needed:
+                # Overwriting is allowed; back up whatever is already there
+                if os.path.exists(target_path):
+                    self._create_backup(target_path)
+                
+                with open(target_path, "w", encoding="utf-8") as f:
+                    f.write(action.content or "")
+            else:
+                # Don't overwrite existing files: exclusive-create mode makes the
+                # existence check and the creation one atomic open(O_CREAT | O_EXCL)
+                try:
+                    with open(target_path, "x", encoding="utf-8") as f:
+                        f.write(action.content or "")
+                except FileExistsError:
+                    raise FileExistsError(f"File already exists: {target_path}") from None
         
         elif action.action_type == "fix_content":
-            if not target_path.exists():
+            if not os.path.exists(target_path):
                 raise FileNotFoundError(f"File not found: {target_path}")
             
             # Create backup
@@ -453,7 +546,7 @@ updates:
                 self._create_backup(target_path)
             
             # Write new content
-            with open(target_path, 'w') as f:
+            with open(target_path, "w", encoding="utf-8") as f:
                 f.write(action.content or "")
         
         elif action.action_type == "rename":
@@ -461,6 +554,12 @@ updates:
             # based on the actual naming issue
             pass
     
+    def _ensure_directory(self, path: str):
+        """Create a directory and its parents, once per plan execution"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
     def _create_backup_directory(self):
         """Create backup directory for modified files"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -468,71 +567,90 @@ updates:
         backup_path.mkdir(parents=True, exist_ok=True)
         return backup_path
     
-    def _create_backup(self, file_path: Path):
+    def _create_backup(self, file_path: str):
         """Create backup of a file before modification"""
-        if not self.backup_dir.exists():
-            backup_dir = self._create_backup_directory()
-        else:
-            # Use most recent backup directory
-            backup_dirs = sorted(self.backup_dir.glob("*"))
-            backup_dir = backup_dirs[-1] if backup_dirs else self._create_backup_directory()
-        
-        # Preserve directory structure in backup
-        relative_path = file_path.relative_to(self.repo_path)
-        backup_file = backup_dir / relative_path
-        backup_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        shutil.copy2(file_path, backup_file)
+        # Outside execute_plan there is no active backup directory yet
+        if self._active_backup_dir is None:
+            self._active_backup_dir = self._create_backup_directory()
+        
+        # Preserve directory structure in backup. relpath alone would turn a
+        # target outside the repository into "../..", escaping the backup
+        # directory, so such targets are refused as relative_to refused them
+        repo_root = os.path.abspath(self._repo_root)
+        target = os.path.abspath(file_path)
+        if os.path.commonpath([repo_root, target]) != repo_root:
+            raise ValueError(f"{file_path!r} is not in the subpath of {self._repo_root!r}")
+        backup_file = os.path.join(self._active_backup_dir, os.path.relpath(target, repo_root))
+        self._ensure_directory(os.path.dirname(backup_file))
+        
+        # Contents only: the backup is a restore point, not an archive, so skip
+        # copy2's timestamp/permission/xattr syscalls. copyfile uses the
+        # platform's in-kernel fast copy (sendfile on Linux) where available
+        shutil.copyfile(file_path, backup_file)
     
     def dry_run(self, plan: RemediationPlan) -> str:
         """Generate dry run report showing what would be done"""
-        report = []
-        report.append("# FCM Auto-Remediation Dry Run")
-        report.append("=" * 40)
-        report.append("")
-        report.append(f"**Repository:** {self.repo_path}")
-        report.append(f"**Total Actions:** {len(plan.actions)}")
-        report.append(f"**Estimated Time:** {plan.estimated_time}")
-        report.append("")
+        # Sections open with their own blank separator line and each list is
+        # rendered in one join, so the report streams into a single buffer
+        buf = io.StringIO()
+        w = buf.write
+        w("# FCM Auto-Remediation Dry Run\n")
+        w("=" * 40 + "\n")
+        w(f"\n**Repository:** {self.repo_path}\n")
+        w(f"**Total Actions:** {len(plan.actions)}\n")
+        w(f"**Estimated Time:** {plan.estimated_time}\n")
         
         # Safety summary
-        report.append("## Safety Summary")
-        for level, count in plan.safety_summary.items():
-            if count > 0:
-                report.append(f"- **{level.title()}:** {count} action(s)")
-        report.append("")
+        w("\n## Safety Summary\n")
+        w("".join(
+            f"- **{level.title()}:** {count} action(s)\n"
+            for level, count in plan.safety_summary.items()
+            if count > 0
+        ))
         
         # Prerequisites
         if plan.prerequisites:
-            report.append("## Prerequisites")
-            for prereq in plan.prerequisites:
-                report.append(f"- ❗ {prereq}")
-            report.append("")
+            w("\n## Prerequisites\n")
+            w("".join(f"- ❗ {prereq}\n" for prereq in plan.prerequisites))
         
         # Warnings
         if plan.warnings:
-            report.append("## Warnings")
-            for warning in plan.warnings:
-                report.append(f"- ⚠️ {warning}")
-            report.append("")
+            w("\n## Warnings\n")
+            w("".join(f"- ⚠️ {warning}\n" for warning in plan.warnings))
         
         # Actions by safety level
-        for safety_level in ["safe", "caution", "risky"]:
-            level_actions = [a for a in plan.actions if a.safety_level == safety_level]
+        # Re-partitioned from plan.actions, the source of truth, in one pass
+        actions_by_safety = self._partition_by_safety(plan.actions)
+        for safety_level in _SAFETY_LEVELS:
+            level_actions = actions_by_safety.get(safety_level)
             if level_actions:
-                report.append(f"## {safety_level.title()} Actions ({len(level_actions)})")
-                for action in level_actions:
-                    backup_note = " (with backup)" if action.backup_needed else ""
-                    report.append(f"- **{action.action_type}**: {action.description}{backup_note}")
-                report.append("")
+                w(f"\n## {safety_level.title()} Actions ({len(level_actions)})\n")
+                w("".join(
+                    f"- **{action.action_type}**: {action.description}"
+                    f"{' (with backup)' if action.backup_needed else ''}\n"
+                    for action in level_actions
+                ))
         
-        return "\n".join(report)
+        return buf.getvalue()
+
+
+def _load_validator_class() -> Type["FCMRepositoryValidator"]:
+    """Import the repository validator, deferred until a run actually needs it"""
+    try:
+        from ..validators.repo_validator import FCMRepositoryValidator
+    except ImportError:
+        # Run as a script rather than from the package: load the sibling module by path
+        validator_path = Path(__file__).resolve().parents[1] / "validators" / "repo_validator.py"
+        spec = importlib.util.spec_from_file_location("repo_validator", validator_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.FCMRepositoryValidator
+    
+    return FCMRepositoryValidator
 
 
 def main():
     """CLI interface for auto-remediation"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="FCM Repository Auto-Remediation")
     parser.add_argument("repo_path", help="Path to repository")
     parser.add_argument("--validation-result", help="Path to validation result JSON")
@@ -551,8 +669,7 @@ def main():
             validation_result = json.load(f)
     else:
         # Run quick validation
-        from ..validators.repo_validator import FCMRepositoryValidator
-        validator = FCMRepositoryValidator()
+        validator = _load_validator_class()()
         result = validator.validate_repository(args.repo_path)
         validation_result = {
             "violations": result.violations,
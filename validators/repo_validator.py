@@ -6,13 +6,89 @@ Implementation of Layer 3 validation algorithms from the GitHub Repository Model
 
 import os
 import json
+import bisect
+import threading
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+# Directories never descended into when walking a repository
+_PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+# FCM model file naming and format markers
+_FCM_NAME_RE = re.compile(r"^fcm\.[a-z]+(-[a-z]+)*\.md$")
+_MODEL_ID_MARKERS = ("**Model ID**:", "model_id:")
+_LAYER_MARKER = "## Layer 1:"
+
+# Phase weights used when the schema's validation_rules does not set them
+_DEFAULT_WEIGHTS = {
+    "structural": 0.3,
+    "content": 0.3,
+    "process": 0.2,
+    "security": 0.2
+}
+
+# Manifest contract
+_MANIFEST_NAME = "fcm.manifest.json"
+_MANIFEST_FIELDS = ("type", "category", "name", "version")
+_VALID_CATEGORIES = frozenset({"framework", "systems", "domains", "works", "projects", "lab", "personal"})
+
+# Any one of these satisfies the security policy check
+_SECURITY_FILES = frozenset({"SECURITY.md", ".github/SECURITY.md", "docs/SECURITY.md"})
+_DEPENDABOT_FILE = ".github/dependabot.yml"
+
+# Fixed heads of violation messages (the text before ": ", or the whole
+# message when it has no detail), shared with the recommendation table
+_MISSING_DIR = "Missing required directory"
+_MISSING_FILE = "Missing required file"
+_README_TOO_SHORT = "README.md is too short (minimum 100 characters)"
+_README_NO_SECTIONS = "README.md missing proper markdown sections"
+_README_UNREADABLE = "Error reading README.md"
+_MANIFEST_MISSING_FIELD = "Manifest missing required field"
+_MANIFEST_INVALID_JSON = "Invalid JSON in manifest"
+_MANIFEST_UNREADABLE = "Error reading manifest"
+
+_NAMING_SUFFIX = " doesn't follow FCM naming convention"
+
+# Recommendation templates; {detail} is the text after the last ": "
+_MISSING_DIR_RECOMMENDATION = "Create directory: mkdir -p {detail}"
+_MISSING_FILE_RECOMMENDATION = "Create file: touch {detail}"
+_README_RECOMMENDATION = "Improve README.md: Add title, description, and usage sections"
+_MANIFEST_RECOMMENDATION = "Fix fcm.manifest.json: Ensure all required fields are present"
+_NAMING_RECOMMENDATION = "Fix naming: Use kebab-case for files, lowercase for directories"
+
+# Fast path for whole violation messages that carry no detail
+_RECOMMENDATIONS = {
+    _README_TOO_SHORT: _README_RECOMMENDATION,
+    _README_NO_SECTIONS: _README_RECOMMENDATION,
+}
+
+# Every other violation is matched by substring, first rule wins; names and
+# error text embedded in a message can match (e.g. a model "fcm.README.md")
+_RECOMMENDATION_RULES = (
+    (_MISSING_DIR, _MISSING_DIR_RECOMMENDATION),
+    (_MISSING_FILE, _MISSING_FILE_RECOMMENDATION),
+    ("README.md", _README_RECOMMENDATION),
+    ("manifest", _MANIFEST_RECOMMENDATION),
+    ("naming convention", _NAMING_RECOMMENDATION),
+    # "Manifest" is capitalised here, so the rule above never matches it
+    (_MANIFEST_MISSING_FIELD, _MANIFEST_RECOMMENDATION),
+)
+
+# Most validation results kept for reuse; the least recently used are dropped
+_RESULT_CACHE_SIZE = 64
+
+# Model files are read on a thread pool once there are enough to overlap
+_READ_WORKERS = 4
+_PARALLEL_READ_MIN = 8
+
+
 class ComplianceLevel(Enum):
     """Repository compliance levels from the formal model"""
     BASIC = 0       # README, LICENSE exist
@@ -23,6 +99,11 @@ class ComplianceLevel(Enum):
     EXEMPLARY = 5   # organizational best practices
 
 
+# Minimum score for each level above BASIC, in ascending order
+_LEVEL_THRESHOLDS = (0.2, 0.4, 0.6, 0.8, 0.9)
+_LEVELS = tuple(ComplianceLevel)
+
+
 @dataclass
 class ValidationResult:
     """Result of repository validation"""
@@ -44,21 +125,106 @@ class RepositorySchema:
     special_requirements: Dict[str, bool] = field(default_factory=dict)
 
 
+@dataclass
+class RepoSnapshot:
+    """File-system snapshot of a repository taken by a single walk"""
+    root: str
+    base: str = ""                                     # prefix for child paths, "" for root "."
+    files: set = field(default_factory=set)            # relative paths, "/"-separated
+    dirs: set = field(default_factory=set)
+    listings: Dict[str, List[str]] = field(default_factory=dict)  # dir -> entry names
+    model_files: List[Tuple[str, str]] = field(default_factory=list)  # (path, name)
+    dir_names: List[str] = field(default_factory=list)
+    manifest: Any = None                               # parsed fcm.manifest.json
+    manifest_error: Optional[Exception] = None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _key(rel_path: str) -> str:
+        # Lookups use a small fixed set of schema paths, so normalise each once
+        key = os.path.normpath(rel_path).replace(os.sep, "/")
+        return "" if key == "." else key
+    
+    # The sets match names exactly, so a miss is confirmed on disk: on
+    # case-insensitive file systems (macOS, Windows) a probe for README.md
+    # also finds readme.md, as the stat-based checks always did
+    def _disk_path(self, rel_path: str) -> str:
+        return os.path.join(self.base, rel_path)
+    
+    def is_file(self, rel_path: str) -> bool:
+        return self._key(rel_path) in self.files or os.path.isfile(self._disk_path(rel_path))
+    
+    def is_dir(self, rel_path: str) -> bool:
+        return self._key(rel_path) in self.dirs or os.path.isdir(self._disk_path(rel_path))
+    
+    def exists(self, rel_path: str) -> bool:
+        key = self._key(rel_path)
+        return key in self.files or key in self.dirs or os.path.exists(self._disk_path(rel_path))
+    
+    def listing(self, rel_path: str) -> List[str]:
+        names = self.listings.get(self._key(rel_path))
+        if names is not None:
+            return names
+        try:
+            return os.listdir(self._disk_path(rel_path))
+        except OSError:
+            return []
+
+
 class FCMRepositoryValidator:
     """
     Main repository validator implementing the GitHub Repository Model
     """
     
-    def __init__(self, schema_path: str = "schemas/fcm-repository.json"):
-        """Initialize validator with schema"""
+    def __init__(self, schema_path: str = "schemas/fcm-repository.json", enable_cache: bool = False):
+        """
+        Initialize validator with schema.
+        
+        enable_cache makes validate_repository reuse results for unchanged
+        repositories (validate_repositories always does). A result counts as
+        unchanged while the layout and the mtime and size of every file whose
+        content is read stay the same, so a same-size edit within the file
+        system's timestamp granularity can return a stale result.
+        """
         self.schema = self._load_schema(schema_path)
         self.repo_schemas = self._load_repository_schemas()
+        self.weights = self._load_weights()
+        
+        # Results of earlier validations, keyed by what they were computed from
+        self.enable_cache = enable_cache
+        self._result_cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Created on first use and reused across validations
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def _executor(self) -> ThreadPoolExecutor:
+        """Shared thread pool for blocking file reads"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=_READ_WORKERS, thread_name_prefix="fcm-validator")
+            return self._pool
+    
+    def close(self):
+        """Shut down the validator's thread pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
     
     def _load_schema(self, schema_path: str) -> Dict[str, Any]:
         """Load validation schema from JSON file"""
         with open(schema_path, 'r') as f:
             return json.load(f)
     
+    def _load_weights(self) -> Tuple[float, float, float, float]:
+        """Phase weights (structural, content, process, security) from the schema"""
+        validation_rules = self.schema.get("validation_rules", {})
+        return tuple(
+            validation_rules.get(phase, {}).get("weight", default)
+            for phase, default in _DEFAULT_WEIGHTS.items()
+        )
+    
     def _load_repository_schemas(self) -> Dict[str, RepositorySchema]:
         """Load repository type-specific schemas"""
         schemas = {}
@@ -76,15 +242,37 @@ class FCMRepositoryValidator:
         
         return schemas
     
-    def validate_repository(self, repo_path: str, repo_type: str = None) -> ValidationResult:
+    def validate_repository(self, repo_path: str, repo_type: str = None,
+                            use_cache: Optional[bool] = None) -> ValidationResult:
         """
-        Main validation function implementing Layer 3 algorithms
+        Main validation function implementing Layer 3 algorithms.
+        
+        use_cache overrides the validator's enable_cache setting for this call.
         """
-        repo_path = Path(repo_path)
+        if use_cache is None:
+            use_cache = self.enable_cache
+        
+        # Normalised once; everything below works on this string
+        repo_path = str(Path(repo_path))
+        
+        # Every phase reads this instead of probing the file system
+        snap = self._snapshot(repo_path)
+        
+        # Unchanged repositories return the result computed last time
+        if use_cache:
+            cache_key = self._cache_key(snap, repo_type)
+            with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    return self._copy_result(cached)
+        
+        # Only a miss reads file contents, starting with the manifest
+        self._load_manifest(snap)
         
         # Auto-detect repository type if not provided
         if not repo_type:
-            repo_type = self._detect_repository_type(repo_path)
+            repo_type = self._detect_repository_type(repo_path, snap)
         
         if repo_type not in self.repo_schemas:
             raise ValueError(f"Unknown repository type: {repo_type}")
@@ -92,40 +280,24 @@ class FCMRepositoryValidator:
         schema = self.repo_schemas[repo_type]
         
         # Layer 3 Algorithm: Structure validation
-        structural_score, structural_violations = self._validate_structure(repo_path, schema)
+        structural_score, structural_violations = self._validate_structure(repo_path, schema, snap)
         
         # Layer 3 Algorithm: Content validation  
-        content_score, content_violations = self._validate_content(repo_path, schema)
+        content_score, content_violations = self._validate_content(repo_path, schema, snap)
         
         # Layer 3 Algorithm: Process validation
-        process_score, process_violations = self._validate_processes(repo_path, schema)
+        process_score, process_violations = self._validate_processes(repo_path, schema, snap)
         
         # Layer 3 Algorithm: Security validation
-        security_score, security_violations = self._validate_security(repo_path, schema)
+        security_score, security_violations = self._validate_security(repo_path, schema, snap)
         
         # Calculate overall score using weights from schema
-        # Default weights if not specified in schema
-        default_weights = {
-            "structural": 0.3,
-            "content": 0.3,
-            "process": 0.2,
-            "security": 0.2
-        }
-        
-        # Try to get weights from schema, fallback to defaults
-        validation_rules = self.schema.get("validation_rules", {})
-        weights = {
-            "structural": validation_rules.get("structural", {}).get("weight", default_weights["structural"]),
-            "content": validation_rules.get("content", {}).get("weight", default_weights["content"]),
-            "process": validation_rules.get("process", {}).get("weight", default_weights["process"]),
-            "security": validation_rules.get("security", {}).get("weight", default_weights["security"])
-        }
-        
+        structural_weight, content_weight, process_weight, security_weight = self.weights
         overall_score = (
-            structural_score * weights["structural"] +
-            content_score * weights["content"] +
-            process_score * weights["process"] +
-            security_score * weights["security"]
+            structural_score * structural_weight +
+            content_score * content_weight +
+            process_score * process_weight +
+            security_score * security_weight
         )
         
         # Create ValidationResult with calculated score
@@ -152,31 +324,148 @@ class FCMRepositoryValidator:
             "overall_health": result.score
         }
         
+        if use_cache:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = self._copy_result(result)
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        
         return result
     
-    def _detect_repository_type(self, repo_path: Path) -> str:
-        """Auto-detect repository type from manifest or structure"""
-        manifest_path = repo_path / "fcm.manifest.json"
+    def validate_repositories(self, repo_paths: List[str],
+                              repo_types: Optional[List[Optional[str]]] = None) -> List[ValidationResult]:
+        """
+        Validate many repositories concurrently, returning results in input order.
         
-        if manifest_path.exists():
-            try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                    return manifest.get("category", "personal")
-            except (json.JSONDecodeError, KeyError):
-                pass
+        The repositories share this validator's schema, result cache and
+        model-read pool; the result cache is used regardless of enable_cache.
+        Most of the time goes to directory scans and file reads, which release
+        the GIL. An exception from any repository propagates once the earlier
+        results are collected.
+        """
+        if repo_types is None:
+            repo_types = [None] * len(repo_paths)
+        elif len(repo_types) != len(repo_paths):
+            raise ValueError("repo_types must match repo_paths in length")
+        
+        # A separate pool: its workers block on reads queued on the model-read pool
+        with ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="fcm-batch") as pool:
+            return list(pool.map(self.validate_repository, repo_paths, repo_types,
+                                 [True] * len(repo_paths)))
+    
+    def _cache_key(self, snap: RepoSnapshot, repo_type: Optional[str]) -> tuple:
+        """
+        Key a validation by the repository layout and the stat of every file
+        whose content is read; the schema is fixed for the validator's lifetime
+        """
+        content_stats = []
+        for rel_path in ("README.md", _MANIFEST_NAME):
+            content_stats.append(self._stat_key(os.path.join(snap.root, rel_path)))
+        for path, _ in snap.model_files:
+            content_stats.append((path, self._stat_key(path)))
+        
+        return (
+            os.path.realpath(snap.root),
+            repo_type,
+            frozenset(snap.files),
+            frozenset(snap.dirs),
+            tuple(content_stats)
+        )
+    
+    def _stat_key(self, path: str) -> Optional[Tuple[int, int]]:
+        """Modification time and size of a file, or None if it cannot be stat'ed"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def _copy_result(self, result: ValidationResult) -> ValidationResult:
+        """Copy a result so cached entries are not shared with callers"""
+        return ValidationResult(
+            score=result.score,
+            violations=list(result.violations),
+            compliance_level=result.compliance_level,
+            recommendations=list(result.recommendations),
+            health_metrics=dict(result.health_metrics)
+        )
+    
+    def _detect_repository_type(self, repo_path: str, snap: RepoSnapshot) -> str:
+        """Auto-detect repository type from manifest or structure"""
+        if isinstance(snap.manifest, dict):
+            return snap.manifest.get("category", "personal")
         
         # Fallback to structure-based detection
-        if (repo_path / "core").exists() and (repo_path / "composite").exists():
+        if snap.exists("core") and snap.exists("composite"):
             return "framework"
-        elif (repo_path / "analytical").exists() or (repo_path / "empirical").exists():
+        elif snap.exists("analytical") or snap.exists("empirical"):
             return "systems"
-        elif (repo_path / "experiments").exists():
+        elif snap.exists("experiments"):
             return "lab"
         else:
             return "personal"
     
-    def _validate_structure(self, repo_path: Path, schema: RepositorySchema) -> Tuple[float, List[str]]:
+    def _snapshot(self, repo_path: str) -> RepoSnapshot:
+        """
+        Walk the repository once with os.scandir, recording every file and
+        directory plus the FCM model files (entries named ``fcm.*.md``) and
+        directory names in the order ``Path.rglob`` would list them
+        """
+        # Path(".") / name is just name, so children of a "." root are quoted
+        # without the "./" that DirEntry.path would give them
+        snap = RepoSnapshot(root=repo_path, base="" if repo_path == "." else repo_path)
+        files = snap.files
+        dirs = snap.dirs
+        
+        # Depth-first, each directory's entries before its subdirectories
+        pending = [(snap.base, "")]
+        while pending:
+            path, rel = pending.pop()
+            try:
+                with os.scandir(path or ".") as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            dirs.add(rel)
+            snap.listings[rel] = [entry.name for entry in entries]
+            prefix = rel + "/" if rel else ""
+            path_prefix = os.path.join(path, "") if path else ""
+            
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                # Equivalent to fnmatch "fcm.*.md"
+                if len(name) >= 7 and name.startswith("fcm.") and name.endswith(".md"):
+                    snap.model_files.append((path_prefix + name, name))
+                
+                # is_dir()/is_file() follow symlinks, as Path.exists() does
+                try:
+                    if entry.is_dir():
+                        dirs.add(prefix + name)
+                        snap.dir_names.append(name)
+                        if name not in _PRUNED_DIRS and not entry.is_symlink():
+                            subdirs.append((path_prefix + name, prefix + name))
+                    elif entry.is_file():
+                        files.add(prefix + name)
+                except OSError:
+                    pass
+            
+            pending.extend(reversed(subdirs))
+        
+        return snap
+    
+    def _load_manifest(self, snap: RepoSnapshot):
+        """Parse the manifest once for type detection and validation"""
+        if snap.exists(_MANIFEST_NAME):
+            try:
+                with open(os.path.join(snap.base, _MANIFEST_NAME), 'rb') as f:
+                    snap.manifest = json.loads(f.read())
+            except Exception as e:
+                snap.manifest_error = e
+    
+    def _validate_structure(self, repo_path: str, schema: RepositorySchema,
+                            snap: RepoSnapshot) -> Tuple[float, List[str]]:
         """
         Implement structure validation algorithm from Layer 3
         """
@@ -187,23 +476,21 @@ class FCMRepositoryValidator:
         # Check required directories
         for dir_name in schema.required_directories:
             max_score += 1
-            dir_path = repo_path / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+            if snap.is_dir(dir_name):
                 score += 1
             else:
-                violations.append(f"Missing required directory: {dir_name}")
+                violations.append(f"{_MISSING_DIR}: {dir_name}")
         
         # Check required files
         for file_name in schema.required_files:
             max_score += 1
-            file_path = repo_path / file_name
-            if file_path.exists() and file_path.is_file():
+            if snap.is_file(file_name):
                 score += 1
             else:
-                violations.append(f"Missing required file: {file_name}")
+                violations.append(f"{_MISSING_FILE}: {file_name}")
         
         # Check naming conventions
-        naming_violations = self._check_naming_conventions(repo_path, schema.naming_conventions)
+        naming_violations = self._check_naming_conventions(schema.naming_conventions, snap)
         violations.extend(naming_violations)
         
         # Calculate score as percentage
@@ -212,15 +499,16 @@ class FCMRepositoryValidator:
         else:
             return 1.0, violations
     
-    def _validate_content(self, repo_path: Path, schema: RepositorySchema) -> Tuple[float, List[str]]:
+    def _validate_content(self, repo_path: str, schema: RepositorySchema,
+                          snap: RepoSnapshot) -> Tuple[float, List[str]]:
         """Validate content requirements"""
         score = 0
         max_score = 0
         violations = []
         
         # Check README.md content
-        readme_path = repo_path / "README.md"
-        if readme_path.exists():
+        readme_path = os.path.join(snap.base, "README.md")
+        if snap.exists("README.md"):
             max_score += 1
             readme_valid, readme_violations = self._validate_readme(readme_path)
             if readme_valid:
@@ -229,20 +517,18 @@ class FCMRepositoryValidator:
                 violations.extend(readme_violations)
         
         # Check manifest content
-        manifest_path = repo_path / "fcm.manifest.json"
-        if manifest_path.exists():
+        if snap.exists(_MANIFEST_NAME):
             max_score += 1
-            manifest_valid, manifest_violations = self._validate_manifest(manifest_path)
+            manifest_valid, manifest_violations = self._validate_manifest(snap)
             if manifest_valid:
                 score += 1
             else:
                 violations.extend(manifest_violations)
         
         # Check FCM model compliance
-        model_files = list(repo_path.rglob("fcm.*.md"))
-        if model_files:
+        if snap.model_files:
             max_score += 1
-            models_valid, model_violations = self._validate_fcm_models(model_files)
+            models_valid, model_violations = self._validate_fcm_models(snap.model_files)
             if models_valid:
                 score += 1
             else:
@@ -253,180 +539,199 @@ class FCMRepositoryValidator:
         else:
             return 1.0, violations
     
-    def _validate_processes(self, repo_path: Path, schema: RepositorySchema) -> Tuple[float, List[str]]:
+    def _validate_processes(self, repo_path: str, schema: RepositorySchema,
+                            snap: RepoSnapshot) -> Tuple[float, List[str]]:
         """Validate CI/CD and automation processes"""
         score = 0
         max_score = 3
         violations = []
         
         # Check for GitHub workflows
-        workflows_dir = repo_path / ".github" / "workflows"
-        if workflows_dir.exists() and list(workflows_dir.glob("*.yml")):
+        workflows = snap.listing(".github/workflows")
+        if any(name.endswith(".yml") for name in workflows):
             score += 1
         else:
             violations.append("No GitHub workflows found")
         
         # Check for validation scripts
-        if (repo_path / "validation").exists() or (repo_path / "tools").exists():
+        if snap.exists("validation") or snap.exists("tools"):
             score += 1
         else:
             violations.append("No validation tools found")
         
         # Check for automation indicators
-        if (repo_path / "scripts").exists() or (repo_path / "Makefile").exists():
+        if snap.exists("scripts") or snap.exists("Makefile"):
             score += 1
         else:
             violations.append("No automation scripts found")
         
         return score / max_score, violations
     
-    def _validate_security(self, repo_path: Path, schema: RepositorySchema) -> Tuple[float, List[str]]:
+    def _validate_security(self, repo_path: str, schema: RepositorySchema,
+                           snap: RepoSnapshot) -> Tuple[float, List[str]]:
         """Validate security policies and configurations"""
         score = 0
         max_score = 2
         violations = []
         
         # Check for security policy
-        security_files = ["SECURITY.md", ".github/SECURITY.md", "docs/SECURITY.md"]
-        if any((repo_path / f).exists() for f in security_files):
+        # Existence checks, so a directory of that name also counts; the set
+        # test settles the common case before any per-path probe
+        if (not (snap.files.isdisjoint(_SECURITY_FILES) and snap.dirs.isdisjoint(_SECURITY_FILES))
+                or any(map(snap.exists, _SECURITY_FILES))):
             score += 1
         else:
             violations.append("No security policy found")
         
         # Check for dependency scanning
-        if (repo_path / ".github" / "dependabot.yml").exists():
+        if snap.exists(_DEPENDABOT_FILE):
             score += 1
         else:
             violations.append("No dependency scanning configured")
         
         return score / max_score, violations
     
-    def _check_naming_conventions(self, repo_path: Path, conventions: Dict[str, str]) -> List[str]:
+    def _check_naming_conventions(self, conventions: Dict[str, str], snap: RepoSnapshot) -> List[str]:
         """Check naming convention compliance"""
         violations = []
         
         # Check FCM model naming
-        model_files = list(repo_path.rglob("fcm.*.md"))
-        for model_file in model_files:
-            if not re.match(r"^fcm\.[a-z]+(-[a-z]+)*\.md$", model_file.name):
-                violations.append(f"Model file {model_file.name} doesn't follow FCM naming convention")
+        for _, name in snap.model_files:
+            if not _FCM_NAME_RE.match(name):
+                violations.append(f"Model file {name}{_NAMING_SUFFIX}")
         
         # Check directory naming (should be lowercase)
-        for item in repo_path.rglob("*"):
-            if item.is_dir() and item.name != item.name.lower():
-                violations.append(f"Directory {item.name} should be lowercase")
+        for dir_name in snap.dir_names:
+            if dir_name != dir_name.lower():
+                violations.append(f"Directory {dir_name} should be lowercase")
         
         return violations
     
-    def _validate_readme(self, readme_path: Path) -> Tuple[bool, List[str]]:
+    def _validate_readme(self, readme_path: str) -> Tuple[bool, List[str]]:
         """Validate README.md content"""
         violations = []
         
         try:
-            content = readme_path.read_text()
+            # Read and decode in full: an undecodable byte anywhere is reported,
+            # and universal newlines keep the length in characters
+            with open(readme_path, 'r') as f:
+                content = f.read()
             
             # Check minimum length
             if len(content) < 100:
-                violations.append("README.md is too short (minimum 100 characters)")
+                violations.append(_README_TOO_SHORT)
             
-            # Check for required sections
-            required_sections = ["#", "##"]  # At least title and one section
-            has_sections = any(section in content for section in required_sections)
-            if not has_sections:
-                violations.append("README.md missing proper markdown sections")
+            # Check for markdown sections; any "##" heading also contains "#"
+            if "#" not in content:
+                violations.append(_README_NO_SECTIONS)
             
             return len(violations) == 0, violations
             
         except Exception as e:
-            return False, [f"Error reading README.md: {str(e)}"]
+            return False, [f"{_README_UNREADABLE}: {str(e)}"]
     
-    def _validate_manifest(self, manifest_path: Path) -> Tuple[bool, List[str]]:
+    def _validate_manifest(self, snap: RepoSnapshot) -> Tuple[bool, List[str]]:
         """Validate fcm.manifest.json content"""
         violations = []
         
+        e = snap.manifest_error
+        if isinstance(e, json.JSONDecodeError):
+            return False, [f"{_MANIFEST_INVALID_JSON}: {str(e)}"]
+        elif e is not None:
+            return False, [f"{_MANIFEST_UNREADABLE}: {str(e)}"]
+        
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = snap.manifest
             
             # Check required fields
-            required_fields = ["type", "category", "name", "version"]
-            for field in required_fields:
+            for field in _MANIFEST_FIELDS:
                 if field not in manifest:
-                    violations.append(f"Manifest missing required field: {field}")
+                    violations.append(f"{_MANIFEST_MISSING_FIELD}: {field}")
             
             # Validate repository type
             if "category" in manifest:
-                valid_categories = ["framework", "systems", "domains", "works", "projects", "lab", "personal"]
-                if manifest["category"] not in valid_categories:
+                category = manifest["category"]
+                if not isinstance(category, str) or category not in _VALID_CATEGORIES:
                     violations.append(f"Invalid repository category: {manifest['category']}")
             
             return len(violations) == 0, violations
             
-        except json.JSONDecodeError as e:
-            return False, [f"Invalid JSON in manifest: {str(e)}"]
         except Exception as e:
-            return False, [f"Error reading manifest: {str(e)}"]
+            return False, [f"{_MANIFEST_UNREADABLE}: {str(e)}"]
     
-    def _validate_fcm_models(self, model_files: List[Path]) -> Tuple[bool, List[str]]:
+    def _validate_fcm_models(self, model_files: List[Tuple[str, str]]) -> Tuple[bool, List[str]]:
         """Validate FCM model format compliance"""
         violations = []
         
-        for model_file in model_files:
-            try:
-                content = model_file.read_text()
-                
-                # Check for Model ID
-                if "**Model ID**:" not in content and "model_id:" not in content:
-                    violations.append(f"{model_file.name} missing Model ID")
-                
-                # Check for Layer structure (basic FCM format check)
-                if "## Layer 1:" not in content:
-                    violations.append(f"{model_file.name} missing FCM layer structure")
-                
-            except Exception as e:
-                violations.append(f"Error reading {model_file.name}: {str(e)}")
+        # Reads release the GIL, so many files overlap their I/O on the pool;
+        # map() keeps the violations in file order either way
+        if len(model_files) >= _PARALLEL_READ_MIN:
+            per_file = self._executor().map(self._check_fcm_model, model_files)
+        else:
+            per_file = map(self._check_fcm_model, model_files)
+        
+        for file_violations in per_file:
+            violations.extend(file_violations)
         
         return len(violations) == 0, violations
     
+    def _check_fcm_model(self, model_file: Tuple[str, str]) -> List[str]:
+        """Check a single FCM model file, given as (path, name)"""
+        path, name = model_file
+        violations = []
+        
+        try:
+            # Read and decode in full so an undecodable byte anywhere is
+            # reported. Plain containment uses CPython's vectorised
+            # fastsearch, which outruns a regex alternation pass several times over
+            with open(path, 'r') as f:
+                content = f.read()
+            has_id = any(marker in content for marker in _MODEL_ID_MARKERS)
+            has_layer = _LAYER_MARKER in content
+            
+            # Check for Model ID
+            if not has_id:
+                violations.append(f"{name} missing Model ID")
+            
+            # Check for Layer structure (basic FCM format check)
+            if not has_layer:
+                violations.append(f"{name} missing FCM layer structure")
+            
+        except Exception as e:
+            violations.append(f"Error reading {name}: {str(e)}")
+        
+        return violations
+    
     def _determine_compliance_level(self, score: float, violations: List[str]) -> ComplianceLevel:
         """Determine compliance level based on score and violations"""
-        if score >= 0.9 and len(violations) == 0:
-            return ComplianceLevel.EXEMPLARY
-        elif score >= 0.8:
+        level = _LEVELS[bisect.bisect_right(_LEVEL_THRESHOLDS, score)]
+        
+        # Exemplary repositories must also be free of violations
+        if level is ComplianceLevel.EXEMPLARY and violations:
             return ComplianceLevel.SECURE
-        elif score >= 0.6:
-            return ComplianceLevel.TESTED
-        elif score >= 0.4:
-            return ComplianceLevel.DOCUMENTED
-        elif score >= 0.2:
-            return ComplianceLevel.STRUCTURED
-        else:
-            return ComplianceLevel.BASIC
+        return level
     
     def _generate_recommendations(self, violations: List[str], schema: RepositorySchema) -> List[str]:
         """Generate actionable recommendations based on violations"""
-        recommendations = []
+        # Insertion-ordered set: duplicates collapse, first occurrence wins
+        recommendations: Dict[str, None] = {}
         
         # Group similar violations and provide solutions
         for violation in violations:
-            if "Missing required directory" in violation:
-                dir_name = violation.split(": ")[-1]
-                recommendations.append(f"Create directory: mkdir -p {dir_name}")
-            
-            elif "Missing required file" in violation:
-                file_name = violation.split(": ")[-1]
-                recommendations.append(f"Create file: touch {file_name}")
-            
-            elif "README.md" in violation:
-                recommendations.append("Improve README.md: Add title, description, and usage sections")
-            
-            elif "manifest" in violation:
-                recommendations.append("Fix fcm.manifest.json: Ensure all required fields are present")
-            
-            elif "naming convention" in violation:
-                recommendations.append("Fix naming: Use kebab-case for files, lowercase for directories")
-        
-        return list(set(recommendations))  # Remove duplicates
+            # A missing directory always hits the first substring rule, whatever its detail
+            if violation.startswith(_MISSING_DIR):
+                template = _MISSING_DIR_RECOMMENDATION
+            else:
+                template = _RECOMMENDATIONS.get(violation)
+            if template is None:
+                template = next(
+                    (rule_template for needle, rule_template in _RECOMMENDATION_RULES if needle in violation),
+                    None
+                )
+            if template is not None:
+                recommendations[template.format(detail=violation.rpartition(": ")[2])] = None
+        
+        return list(recommendations)
 
 
 def main():